@@ -11,7 +11,7 @@ from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 from .const import COORDINATOR, DOMAIN, PLATFORMS
-from .coordinator import EufySecurityDataUpdateCoordinator
+from .coordinator import EufySecurityDataUpdateCoordinator, get_discovery_store
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -81,6 +81,11 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """remove stored product state of config entry"""
+    await get_discovery_store(hass).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """reload integration"""
     _LOGGER.debug(f"async_reload_entry 1")
@@ -103,6 +103,11 @@ class EufySecurityAlarmControlPanel(AlarmControlPanelEntity, EufySecurityEntity)
 
         )
 
+    @property
+    def subscribed_properties(self) -> list[str]:
+        """Product properties backing entity state"""
+        return [self.metadata.name, MessageField.GUARD_MODE.value, "alarm", "alarmDelay"]
+
     @property
     def guard_mode_metadata(self) -> Metadata:
         """Get guard mode metadata for device"""
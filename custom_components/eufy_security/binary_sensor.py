@@ -11,6 +11,7 @@ from .coordinator import EufySecurityDataUpdateCoordinator
 from .entity import EufySecurityEntity
 from .eufy_security_api.metadata import Metadata
 from .eufy_security_api.product import Product
+from .eufy_security_api.subscription import ALL_PROPERTIES
 from .eufy_security_api.util import get_child_value
 from .util import get_device_info, get_product_properties_by_filter
 
@@ -52,12 +53,16 @@ class EufySecurityProductEntity(BinarySensorEntity, CoordinatorEntity):
     def __init__(self, coordinator: EufySecurityDataUpdateCoordinator, product: Product) -> None:
         super().__init__(coordinator)
         self.product = product
-        self.product.set_state_update_listener(coordinator.async_update_listeners)
 
         self._attr_unique_id = f"{DOMAIN}_{self.product.product_type.value}_{self.product.serial_no}_debug"
         self._attr_should_poll = False
         self._attr_name = f"{self.product.name} Debug ({self.product.product_type.value})"
 
+    async def async_added_to_hass(self) -> None:
+        """Write state when any property of product changes"""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.product.add_state_update_listener(self.async_write_ha_state, [ALL_PROPERTIES]))
+
     @property
     def is_on(self):
         """Return true if the binary sensor is on."""
@@ -5,7 +5,6 @@ import contextlib
 import logging
 import traceback
 
-from haffmpeg.camera import CameraMjpeg
 from haffmpeg.tools import ImageFrame
 from base64 import b64decode
 from homeassistant.components import ffmpeg
@@ -14,18 +13,19 @@ from homeassistant.components.ffmpeg import DATA_FFMPEG
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
-from homeassistant.helpers.aiohttp_client import async_aiohttp_proxy_stream
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import COORDINATOR, DOMAIN, Schema
 from .coordinator import EufySecurityDataUpdateCoordinator
 from .entity import EufySecurityEntity
+from .mjpeg import MjpegBroadcaster
 from .eufy_security_api.camera import (
     STREAM_SLEEP_SECONDS,
     STREAM_TIMEOUT_SECONDS,
     StreamProvider,
     StreamStatus,
 )
+from .eufy_security_api.const import MessageField
 from .eufy_security_api.metadata import Metadata
 from .eufy_security_api.util import wait_for_value_to_equal
 
@@ -84,6 +84,12 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
 
         # ffmpeg entities
         self.ffmpeg = self.coordinator.hass.data[DATA_FFMPEG]
+        self.mjpeg = MjpegBroadcaster(self.ffmpeg.binary)
+
+    @property
+    def subscribed_properties(self) -> list[str]:
+        """Product properties backing entity state"""
+        return [MessageField.PICTURE.value, MessageField.RTSP_STREAM.value, MessageField.RTSP_STREAM_URL.value, "stream_status"]
 
     async def stream_source(self) -> str:
         if self.is_streaming is False:
@@ -95,17 +101,8 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
         stream_source = await self.stream_source()
         if stream_source is None:
             return await super().handle_async_mjpeg_stream(request)
-        stream = CameraMjpeg(self.ffmpeg.binary)
-        await stream.open_camera(stream_source)
-        try:
-            return await async_aiohttp_proxy_stream(
-                self.hass,
-                request,
-                await stream.get_reader(),
-                self.ffmpeg.ffmpeg_stream_content_type,
-            )
-        finally:
-            await stream.close()
+        # all viewers share a single transcoder
+        return await self.mjpeg.async_handle(request, stream_source, self.ffmpeg.ffmpeg_stream_content_type)
 
     async def async_create_stream(self):
         if self.coordinator.config.no_stream_in_hass is True:
@@ -149,6 +146,13 @@ class EufySecurityCamera(Camera, EufySecurityEntity):
 
     async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
         _LOGGER.debug(f"image 1 - {self.is_streaming} - {self.stream}")
+        if self.is_streaming is True and self.product.stream_provider == StreamProvider.P2P:
+            # decode latest keyframe in process instead of opening a new rtsp session per call
+            image = await self.product.snapshot.async_get_image(width, height)
+            if image is not None:
+                self._last_image = image
+                return self._last_image
+
         if self.is_streaming is True:
             with contextlib.suppress(asyncio.TimeoutError):
                 self._last_image = await asyncio.wait_for(self._get_image_from_stream_url(width, height), STREAM_TIMEOUT_SECONDS)
@@ -33,6 +33,13 @@ class EufySecurityOptionFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(ConfigField.name_for_custom1.name, default=self.config.name_for_custom1): str,
                 vol.Optional(ConfigField.name_for_custom2.name, default=self.config.name_for_custom2): str,
                 vol.Optional(ConfigField.name_for_custom3.name, default=self.config.name_for_custom3): str,
+                vol.Optional(ConfigField.property_throttle.name, default=self.config.property_throttle): str,
+                vol.Optional(ConfigField.discovery_concurrency.name, default=self.config.discovery_concurrency): vol.All(int, vol.Range(min=1, max=20)),
+                vol.Optional(ConfigField.warm_start.name, default=self.config.warm_start): bool,
+                vol.Optional(ConfigField.separate_stream_connection.name, default=self.config.separate_stream_connection): bool,
+                vol.Optional(ConfigField.control_compression.name, default=self.config.control_compression): vol.All(int, vol.Any(0, vol.Range(min=9, max=15))),
+                vol.Optional(ConfigField.stream_compression.name, default=self.config.stream_compression): vol.All(int, vol.Any(0, vol.Range(min=9, max=15))),
+                vol.Optional(ConfigField.compression_measurement.name, default=self.config.compression_measurement): bool,
             }
         )
 
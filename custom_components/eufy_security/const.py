@@ -82,8 +82,14 @@ class PropertyToEntityDescription(Enum):
     stream_provider = EntityDescription(id=auto(), category=EntityCategory.DIAGNOSTIC)
     stream_url = EntityDescription(id=auto(), category=EntityCategory.DIAGNOSTIC)
     stream_status = EntityDescription(id=auto(), category=EntityCategory.DIAGNOSTIC)
-    video_queue_size = EntityDescription(id=auto(), category=EntityCategory.DIAGNOSTIC)
+    video_buffer_level = EntityDescription(id=auto(), state_class=SensorStateClass.MEASUREMENT, unit="%", category=EntityCategory.DIAGNOSTIC)
+    video_dropped_frames = EntityDescription(id=auto(), state_class=SensorStateClass.TOTAL_INCREASING, category=EntityCategory.DIAGNOSTIC)
+    video_dropped_bytes = EntityDescription(id=auto(), state_class=SensorStateClass.TOTAL_INCREASING, unit="B", category=EntityCategory.DIAGNOSTIC)
     audio_queue_size = EntityDescription(id=auto(), category=EntityCategory.DIAGNOSTIC)
+    commands_in_flight = EntityDescription(id=auto(), state_class=SensorStateClass.MEASUREMENT, category=EntityCategory.DIAGNOSTIC)
+    command_timeouts = EntityDescription(id=auto(), state_class=SensorStateClass.TOTAL_INCREASING, category=EntityCategory.DIAGNOSTIC)
+    event_backlog_peak = EntityDescription(id=auto(), state_class=SensorStateClass.MEASUREMENT, category=EntityCategory.DIAGNOSTIC)
+    dropped_events = EntityDescription(id=auto(), state_class=SensorStateClass.TOTAL_INCREASING, category=EntityCategory.DIAGNOSTIC)
 
 
     # device binary sensor
@@ -9,10 +9,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.components.persistent_notification import create
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, DISCONNECTED
 from .eufy_security_api.api_client import ApiClient
+from .eufy_security_api.discovery_cache import DiscoveryCache
 from .eufy_security_api.exceptions import (
     CaptchaRequiredException,
     DriverNotConnectedException,
@@ -23,6 +25,16 @@ from .model import Config
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+DISCOVERY_STORAGE_VERSION = 1
+DISCOVERY_STORAGE_SAVE_DELAY = 10
+WARM_START_RETRY_MIN_SECONDS = 5
+WARM_START_RETRY_MAX_SECONDS = 300
+
+
+def get_discovery_store(hass: HomeAssistant) -> Store:
+    """Store of discovered product definitions and last known states"""
+    return Store(hass, DISCOVERY_STORAGE_VERSION, f"{DOMAIN}.discovery")
+
 
 class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
     """Data update coordinator for integration"""
@@ -32,10 +44,21 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         super().__init__(hass, _LOGGER, name=DOMAIN, update_method=self._update_local, update_interval=timedelta(seconds=self.config.sync_interval))
         self._platforms = []
         self.data = {}
-        self._api = ApiClient(self.config, aiohttp_client.async_get_clientsession(self.hass), self._on_error)
+        self._discovery_store = get_discovery_store(hass)
+        self._discovery_data: dict = None
+        self._discovery_cache = DiscoveryCache(self._save_discovery_cache)
+        self._api = ApiClient(self.config, aiohttp_client.async_get_clientsession(self.hass), self._on_error, self._discovery_cache)
 
     async def initialize(self):
         """Initialize the integration"""
+        self._discovery_cache.load(await self._discovery_store.async_load())
+        if self.config.warm_start is True and self._api.restore_products() is True:
+            # entities are set up from last known state and become available once add-on is connected
+            self.config.entry.async_create_background_task(self.hass, self._async_warm_connect(), f"{DOMAIN}_warm_connect")
+            return
+        await self._connect()
+
+    async def _connect(self):
         try:
             await self._api.connect()
         except CaptchaRequiredException as exc:
@@ -50,6 +73,33 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         except WebSocketConnectionException as exc:
             raise ConfigEntryNotReady() from exc
 
+    async def _async_warm_connect(self):
+        delay = WARM_START_RETRY_MIN_SECONDS
+        while True:
+            try:
+                await self._connect()
+                break
+            except ConfigEntryAuthFailed:
+                self.config.entry.async_start_reauth(self.hass)
+                return
+            except ConfigEntryNotReady:
+                _LOGGER.debug(f"warm start - add-on is not ready, retrying in {delay} seconds")
+            except Exception:  # pylint: disable=broad-except
+                # keep retrying, leaving the loop would keep restored entities unavailable for good
+                _LOGGER.exception(f"warm start - connection failed unexpectedly, retrying in {delay} seconds")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_START_RETRY_MAX_SECONDS)
+
+        _LOGGER.info("warm start - connected to add-on")
+        if self._api.reload_required is True:
+            _LOGGER.info("warm start - products changed since last known state, reloading")
+            self.hass.config_entries.async_schedule_reload(self.config.entry.entry_id)
+
+    def _save_discovery_cache(self, data: dict) -> None:
+        # discovery of many products ends up in single write
+        self._discovery_data = data
+        self._discovery_store.async_delay_save(lambda: data, DISCOVERY_STORAGE_SAVE_DELAY)
+
     @property
     def platforms(self):
         """Initialized platforms list"""
@@ -65,6 +115,11 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         """get stations from API"""
         return self._api.stations
 
+    @property
+    def statistics_serial_no(self) -> str:
+        """get station presenting client statistics from API"""
+        return self._api.statistics_serial_no
+
     async def set_mfa_and_connect(self, mfa_input: str):
         """set mfa and connect"""
         await self._api.set_mfa_and_connect(mfa_input)
@@ -86,6 +141,7 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             _LOGGER.debug(f"coordinator - start update_local")
             await self._api.poll_refresh()
+            self._api.save_product_states()
             _LOGGER.debug(f"coordinator - complete update_local")
             return self.data
         except WebSocketConnectionException as exc:
@@ -93,6 +149,10 @@ class EufySecurityDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def disconnect(self):
         """disconnect from api"""
+        self._api.save_product_states()
+        if self._discovery_data is not None:
+            # write now instead of delayed, so no write is left pending once entry is removed
+            await self._discovery_store.async_save(self._discovery_data)
         await self._api.disconnect()
         self._api = None
         await self.async_shutdown()
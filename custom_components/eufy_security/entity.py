@@ -19,7 +19,6 @@ class EufySecurityEntity(CoordinatorEntity):
     def __init__(self, coordinator: EufySecurityDataUpdateCoordinator, metadata: Metadata) -> None:
         super().__init__(coordinator)
         self.metadata: Metadata = metadata
-        self.product.set_state_update_listener(coordinator.async_update_listeners)
         self._attr_unique_id = f"{DOMAIN}_{self.product.serial_no}_{self.product.product_type.value}_{metadata.name}"
         self._attr_should_poll = False
         self._attr_icon = self.description.icon
@@ -28,6 +27,16 @@ class EufySecurityEntity(CoordinatorEntity):
         self._attr_entity_category = self.description.category
         self._attr_entity_registry_enabled_default = False if self._attr_entity_category == EntityCategory.DIAGNOSTIC else True
 
+    async def async_added_to_hass(self) -> None:
+        """Write state only when backing properties or product level state change"""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.product.add_state_update_listener(self.async_write_ha_state, self.subscribed_properties))
+
+    @property
+    def subscribed_properties(self) -> list[str]:
+        """Product properties backing entity state"""
+        return [self.metadata.name]
+
     @property
     def product(self) -> Product:
         """Get product instance of entity"""
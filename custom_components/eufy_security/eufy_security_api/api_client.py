@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 from enum import Enum
-import json
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
@@ -14,16 +15,31 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 from .camera import Camera
 from .const import (
+    CLIENT_STATISTICS_INTERVAL_SECONDS,
+    CONTROL_CONNECTION_COMPRESSION,
+    DISCOVERY_CONCURRENCY,
+    LIVESTREAM_DATA_EVENTS,
+    RECONNECT_MAX_SECONDS,
+    RECONNECT_MIN_SECONDS,
     SCHEMA_VERSION,
+    STREAM_CONNECTION_COMPRESSION,
+    STREAM_CONNECTION_EVENTS,
+    WARM_START_SKIPPED_PROPERTIES,
     EventNameToHandler,
     EventSourceType,
     MessageField,
     ProductCommand,
     ProductType,
+    StatisticName,
 )
+from .command_scheduler import CommandScheduler
+from .compression import CompressionProbe, get_window_bits
+from .discovery_cache import DiscoveryCache
+from .dispatcher import EventDispatcher
 from .event import Event
 from .exceptions import (
     CaptchaRequiredException,
+    CommandTimeoutException,
     DeviceNotInitializedYetException,
     DriverNotConnectedException,
     FailedCommandException,
@@ -35,19 +51,73 @@ from .exceptions import (
 )
 from .outgoing_message import OutgoingMessage, OutgoingMessageType
 from .product import Device, Product, Station
+from .subscription import StateUpdateRegistry, parse_throttle_windows
 from .web_socket_client import WebSocketClient
 
 
+# keys of camera specific discovery results
+LIVE_STREAMING_RTSP = "rtsp_livestreaming"
+LIVE_STREAMING_P2P = "p2p_livestreaming"
+
+
 class ApiClient:
     """Client to communicate with eufy-security-ws over websocket connection"""
 
-    def __init__(self, config, session: aiohttp.ClientSession, on_error_callback) -> None:
+    def __init__(self, config, session: aiohttp.ClientSession, on_error_callback, discovery_cache: DiscoveryCache = None) -> None:
         self._config = config
-        self._client: WebSocketClient = WebSocketClient(self._config.host, self._config.port, session, self._on_open, self._on_message, self._on_close, self._on_error)
+        self._session: aiohttp.ClientSession = session
+        measure_compression = getattr(self._config, "compression_measurement", False) is True
+        compress = get_window_bits(getattr(self._config, "control_compression", None), CONTROL_CONNECTION_COMPRESSION)
+        self._client: WebSocketClient = WebSocketClient(
+            self._config.host,
+            self._config.port,
+            session,
+            self._on_open,
+            self._on_message,
+            self._on_close,
+            self._on_error,
+            compress=compress,
+            probe=CompressionProbe("control", compress) if measure_compression is True else None,
+        )
+        # livestream data gets its own connection, so video payloads do not delay control responses
+        self._stream_client: WebSocketClient = None
+        if getattr(self._config, "separate_stream_connection", False) is True:
+            compress = get_window_bits(getattr(self._config, "stream_compression", None), STREAM_CONNECTION_COMPRESSION)
+            self._stream_client = WebSocketClient(
+                self._config.host,
+                self._config.port,
+                session,
+                None,
+                self._on_stream_message,
+                self._on_stream_close,
+                self._on_error,
+                compress=compress,
+                probe=CompressionProbe("stream", compress) if measure_compression is True else None,
+            )
+        self._stream_connect_lock = asyncio.Lock()
+        self._stream_message_ids: set[str] = set()
+        # cameras whose livestream was started over stream connection
+        self._stream_serial_nos: set[str] = set()
         self._on_error_callback = on_error_callback
         self._result_futures: dict[str, asyncio.Future] = {}
+        self.command_timeouts = 0
+        self.command_scheduler = CommandScheduler()
+        self.event_dispatcher = EventDispatcher(statistics_callback=self._on_dispatcher_statistics)
+        self.discovery_cache: DiscoveryCache = discovery_cache or DiscoveryCache()
+        self._revalidation_tasks: set[asyncio.Task] = set()
+        self.state_update_registry = StateUpdateRegistry(parse_throttle_windows(getattr(self._config, "property_throttle", None)))
         self._devices: dict = None
         self._stations: dict = None
+        # event source to products of that source, built when products change instead of per event
+        self._product_routes: dict[str, dict] = {}
+        self._statistics_serial_no: str = None
+        self._changed_statistics: set[StatisticName] = set()
+        self._statistics_timer: asyncio.TimerHandle = None
+        self._update_routes()
+        self._restored = False
+        self._discovered = False
+        self._reconnect_task: asyncio.Task = None
+        self.reload_required = False
         self._captcha_future: asyncio.Future[dict] = asyncio.get_event_loop().create_future()
         self._mfa_future: asyncio.Future[dict] = asyncio.get_event_loop().create_future()
 
@@ -61,13 +131,51 @@ class ApiClient:
         """initialized stations"""
         return self._stations
 
+    @property
+    def statistics_serial_no(self) -> str | None:
+        """Station presenting client wide statistics"""
+        return self._statistics_serial_no
+
+    @property
+    def commands_in_flight(self) -> int:
+        """Number of commands waiting for add-on response"""
+        return len(self._result_futures)
+
+    @property
+    def command_statistics(self) -> dict:
+        """Counters and latencies of command priority lanes"""
+        return {priority.name: statistics.as_dict() for priority, statistics in self.command_scheduler.statistics.items()}
+
+    @property
+    def event_statistics(self) -> dict:
+        """Backlog counters of product mailboxes"""
+        return {
+            "backlog": self.event_dispatcher.backlog,
+            "products": {serial_no: statistics.__dict__ for serial_no, statistics in self.event_dispatcher.statistics.items()},
+        }
+
+    @property
+    def compression_statistics(self) -> dict:
+        """Compression measurement of connections, empty if measurement mode is off"""
+        statistics = {}
+        for client in (self._client, self._stream_client):
+            if client is not None and client.probe is not None:
+                statistics[client.probe.name] = client.probe.report()
+        return statistics
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """shared http session"""
+        return self._session
+
     async def ws_connect(self):
         """set initial websocket connection"""
         await self._client.connect()
 
     async def connect(self):
         """Set up web socket connection and set products"""
-        await self.ws_connect()
+        if self.available is False:
+            await self.ws_connect()
         await self._set_schema(SCHEMA_VERSION)
         await self._set_products()
 
@@ -102,32 +210,147 @@ class ApiClient:
         if result[MessageField.STATE.value][EventSourceType.driver.name][MessageField.CONNECTED.value] is False:
             await self._check_interactive_mode()
 
-        self._devices = await self._get_products(ProductType.device, result[MessageField.STATE.value]["devices"])
-        self._stations = await self._get_products(ProductType.station, result[MessageField.STATE.value]["stations"])
-
-    async def _get_products(self, product_type: ProductType, products: list) -> dict:
-        response = {}
-        for serial_no in products:
-            product: Product = None
+        # devices and stations share one limit, so add-on is not flooded with requests
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(getattr(self._config, "discovery_concurrency", None) or DISCOVERY_CONCURRENCY)
+        restored_serial_nos = set(self._devices or {}) | set(self._stations or {})
+        self._devices, self._stations = await asyncio.gather(
+            self._get_products(ProductType.device, result[MessageField.STATE.value]["devices"], semaphore),
+            self._get_products(ProductType.station, result[MessageField.STATE.value]["stations"], semaphore),
+        )
+        self._update_routes()
+        _LOGGER.info(f"_set_products - discovered {len(self._devices)} devices and {len(self._stations)} stations in {time.monotonic() - start:.2f} seconds")
+
+        serial_nos = list(self._devices) + list(self._stations)
+        if self._restored is True:
+            if restored_serial_nos != set(serial_nos):
+                # products were added or removed since last known state, entities have to be recreated
+                self.reload_required = True
+            for serial_no in serial_nos:
+                self.state_update_registry.notify_product(serial_no)
+            self._restored = False
+        self.discovery_cache.retain(serial_nos)
+        self.save_product_states()
+        self._discovered = True
+
+    def restore_products(self) -> bool:
+        """Create products from last known state, so entities can be set up before connecting"""
+        devices, stations = {}, {}
+        for serial_no, (product_type, properties, metadata, commands, extras) in self.discovery_cache.get_states().items():
+            product_type = ProductType[product_type]
+            products = devices if product_type == ProductType.device else stations
+            products[serial_no] = self._create_product(product_type, serial_no, properties, metadata, commands, extras)
+        if not devices and not stations:
+            return False
+        self._devices, self._stations = devices, stations
+        self._update_routes()
+        self._restored = True
+        _LOGGER.info(f"restore_products - restored {len(devices)} devices and {len(stations)} stations from last known state")
+        return True
+
+    def save_product_states(self) -> None:
+        """Persist last known property values of products"""
+        for product in list((self._devices or {}).values()) + list((self._stations or {}).values()):
+            properties = {name: value for name, value in product.properties.items() if name not in WARM_START_SKIPPED_PROPERTIES}
+            extras = {MessageField.VOICES.value: product.voices} if isinstance(product, Camera) else {}
+            self.discovery_cache.set_state(product.serial_no, product.product_type.name, properties, extras)
+
+    async def _get_products(self, product_type: ProductType, products: list, semaphore: asyncio.Semaphore) -> dict:
+        async def get_product(serial_no: str) -> Product:
+            async with semaphore:
+                return await self._get_product(product_type, serial_no)
+
+        result = await asyncio.gather(*[get_product(serial_no) for serial_no in products])
+        return dict(zip(products, result))
+
+    async def _get_product(self, product_type: ProductType, serial_no: str) -> Product:
+        start = time.monotonic()
+        properties, metadata, commands = await self._get_product_definition(product_type, serial_no)
+
+        extras = {}
+        product_class = self._get_product_class(product_type, commands)
+        if product_class is Camera:
+            extras[LIVE_STREAMING_RTSP], extras[LIVE_STREAMING_P2P], extras[MessageField.VOICES.value] = await asyncio.gather(
+                self._get_is_rtsp_streaming(product_type, serial_no),
+                self._get_is_p2p_streaming(product_type, serial_no),
+                self._get_voices(product_type, serial_no),
+            )
+        elif product_class is Station:
+            properties[MessageField.CONNECTED.value] = await self._get_is_connected(product_type, serial_no)
+
+        products = self._devices if product_type == ProductType.device else self._stations
+        restored = (products or {}).get(serial_no, None) if self._restored is True else None
+        if restored is None:
+            product = self._create_product(product_type, serial_no, properties, metadata, commands, extras)
+        else:
+            # keep restored instance, entities are already bound to it
+            if type(restored) is not product_class or restored.reconcile(properties, self._get_product_metadata(product_class, metadata), commands) is False:
+                self.reload_required = True
+            if isinstance(restored, Camera):
+                restored.voices = extras.get(MessageField.VOICES.value, restored.voices)
+            product = restored
+
+        _LOGGER.debug(f"_get_product - {serial_no} - {time.monotonic() - start:.2f} seconds")
+        return product
+
+    def _get_product_class(self, product_type: ProductType, commands: list) -> type:
+        if product_type == ProductType.station:
+            return Station
+        if ProductCommand.start_livestream.name in commands:
+            return Camera
+        return Device
+
+    def _get_product_metadata(self, product_class: type, metadata: dict) -> dict:
+        if product_class is Station:
+            return {**metadata, MessageField.CONNECTED.value: {'key': MessageField.CONNECTED.value,'name': MessageField.CONNECTED.value,'label': 'Connected','readable': True,'writeable': False,'type': 'boolean'}}
+        return metadata
+
+    def _create_product(self, product_type: ProductType, serial_no: str, properties: dict, metadata: dict, commands: list, extras: dict) -> Product:
+        product_class = self._get_product_class(product_type, commands)
+        metadata = self._get_product_metadata(product_class, metadata)
+        if product_class is Camera:
+            return Camera(
+                self,
+                serial_no,
+                properties,
+                metadata,
+                commands,
+                self._config,
+                extras.get(LIVE_STREAMING_RTSP, False),
+                extras.get(LIVE_STREAMING_P2P, False),
+                extras.get(MessageField.VOICES.value, {}),
+            )
+        return product_class(self, serial_no, properties, metadata, commands)
+
+    async def _get_product_definition(self, product_type: ProductType, serial_no: str) -> tuple[dict, dict, list]:
+        if self.discovery_cache.has(serial_no) is True:
             properties = await self._get_properties(product_type, serial_no)
-            metadata = await self._get_metadata(product_type, serial_no)
-            commands = await self._get_commands(product_type, serial_no)
-
-            if product_type == ProductType.device:
-                if ProductCommand.start_livestream.name in commands:
-                    is_rtsp_streaming = await self._get_is_rtsp_streaming(product_type, serial_no)
-                    is_p2p_streaming = await self._get_is_p2p_streaming(product_type, serial_no)
-                    voices = await self._get_voices(product_type, serial_no)
-                    product = Camera(self, serial_no, properties, metadata, commands, self._config, is_rtsp_streaming, is_p2p_streaming, voices)
-                else:
-                    product = Device(self, serial_no, properties, metadata, commands)
-            else:
-                properties[MessageField.CONNECTED.value] = await self._get_is_connected(product_type, serial_no)
-                metadata[MessageField.CONNECTED.value] = {'key': MessageField.CONNECTED.value,'name': MessageField.CONNECTED.value,'label': 'Connected','readable': True,'writeable': False,'type': 'boolean'}
-                product = Station(self, serial_no, properties, metadata, commands)
-
-            response[serial_no] = product
-        return response
+            software_version = properties.get(MessageField.SOFTWARE_VERSION.value, None)
+            cached = self.discovery_cache.get(serial_no, software_version)
+            if cached is not None:
+                # same firmware, use cached definition and refresh it in background
+                task = asyncio.create_task(self._revalidate_product_definition(product_type, serial_no, software_version))
+                self._revalidation_tasks.add(task)
+                task.add_done_callback(self._revalidation_tasks.discard)
+                return properties, cached[0], cached[1]
+            metadata, commands = await asyncio.gather(self._get_metadata(product_type, serial_no), self._get_commands(product_type, serial_no))
+        else:
+            properties, metadata, commands = await asyncio.gather(
+                self._get_properties(product_type, serial_no),
+                self._get_metadata(product_type, serial_no),
+                self._get_commands(product_type, serial_no),
+            )
+        self.discovery_cache.set(serial_no, properties.get(MessageField.SOFTWARE_VERSION.value, None), metadata, commands)
+        return properties, metadata, commands
+
+    async def _revalidate_product_definition(self, product_type: ProductType, serial_no: str, software_version: str) -> None:
+        try:
+            metadata, commands = await asyncio.gather(self._get_metadata(product_type, serial_no), self._get_commands(product_type, serial_no))
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.debug(f"_revalidate_product_definition - {serial_no} - failed {exc}")
+            return
+        if self.discovery_cache.set(serial_no, software_version, metadata, commands) is True:
+            _LOGGER.info(f"_revalidate_product_definition - {serial_no} - definition changed, it will be used after next reload")
 
     async def set_captcha_and_connect(self, captcha_id: str, captcha_input: str):
         """Set captcha set products"""
@@ -141,12 +364,29 @@ class ApiClient:
         await asyncio.sleep(30)
         # await self._set_products()
 
+    async def _get_stream_client(self) -> WebSocketClient:
+        if self._stream_client is None:
+            return self._client
+        # cameras starting at once must not open the stream connection twice
+        async with self._stream_connect_lock:
+            if self._stream_client.available is False:
+                try:
+                    await self._stream_client.connect()
+                    await self._set_schema(SCHEMA_VERSION, self._stream_client)
+                    await self._start_listening(self._stream_client)
+                    _LOGGER.debug("_get_stream_client - stream connection is established")
+                except WebSocketConnectionException as exc:
+                    _LOGGER.warning(f"_get_stream_client - stream connection failed, using control connection - {exc}")
+                    await self._stream_client.disconnect()
+                    return self._client
+        return self._stream_client
+
     # server level commands
-    async def _start_listening(self):
-        return await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.start_listening))
+    async def _start_listening(self, client: WebSocketClient = None):
+        return await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.start_listening), client)
 
-    async def _set_schema(self, schema_version: int) -> None:
-        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.set_api_schema, schema_version=schema_version))
+    async def _set_schema(self, schema_version: int, client: WebSocketClient = None) -> None:
+        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.set_api_schema, schema_version=schema_version), client)
 
     # driver level commands
     async def _disconnect_driver(self) -> None:
@@ -233,11 +473,16 @@ class ApiClient:
 
     async def start_livestream(self, product_type: ProductType, serial_no: str) -> None:
         """Process start p2p livestream call"""
-        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.start_livestream, serial_no=serial_no))
+        # add-on forwards livestream data only to the connection which started it
+        client = await self._get_stream_client()
+        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.start_livestream, serial_no=serial_no), client)
+        if client is self._stream_client:
+            self._stream_serial_nos.add(serial_no)
 
     async def stop_livestream(self, product_type: ProductType, serial_no: str) -> None:
         """Process stop p2p livestream call"""
-        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.stop_livestream, serial_no=serial_no))
+        await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.stop_livestream, serial_no=serial_no), await self._get_stream_client())
+        self._stream_serial_nos.discard(serial_no)
 
     async def _get_is_p2p_streaming(self, product_type: ProductType, serial_no: str) -> bool:
         result = await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.is_livestreaming, serial_no=serial_no))
@@ -274,12 +519,16 @@ class ApiClient:
         await self._send_message_get_response(OutgoingMessage(OutgoingMessageType.reboot, serial_no=serial_no))
 
     async def _on_message(self, message: dict) -> None:
-        message_str = str(message)[0:15000]
-        if "livestream video data" not in message_str and "livestream audio data" not in message_str:
-            _LOGGER.debug(f"_on_message - {message_str}")
-        else:
-            # _LOGGER.debug(f"_on_message - livestream data received - {len(str(message))}")
-            pass
+        if message[MessageField.TYPE.value] == IncomingMessageType.event.name:
+            event_data = message[IncomingMessageType.event.name]
+            if event_data[IncomingMessageType.event.name] in LIVESTREAM_DATA_EVENTS:
+                # livestream data arrives many times per second, skip logging and generic event routing
+                await self._handle_livestream_data(event_data)
+                return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"_on_message - {str(message)[0:15000]}")
+
         if message[MessageField.TYPE.value] == IncomingMessageType.result.name:
             future = self._result_futures.get(message.get(MessageField.MESSAGE_ID.value, -1), None)
 
@@ -300,21 +549,40 @@ class ApiClient:
         else:
             raise UnexpectedMessageTypeException(message)
 
+    def _update_routes(self) -> None:
+        self._product_routes = {EventSourceType.device.name: self._devices or {}, EventSourceType.station.name: self._stations or {}}
+        # lowest serial number, so statistics stay on same station across restarts
+        self._statistics_serial_no = min(self._stations or {}, default=None)
+
     async def _handle_event(self, event: Event):
-        if event.data[MessageField.SOURCE.value] in [EventSourceType.station.name, EventSourceType.device.name]:
-            # handle device or statino specific events through specific instances
-            plural_product = "_" + event.data[MessageField.SOURCE.value] + "s"
+        products = self._product_routes.get(event.data[MessageField.SOURCE.value], None)
+        if products is not None:
+            # handle device or station specific events through specific instances
             try:
-                product = self.__dict__[plural_product][event.data[MessageField.SERIAL_NO.value]]
-                await product.process_event(event)
-            except (KeyError, TypeError) as exc:
+                product = products[event.data[MessageField.SERIAL_NO.value]]
+            except KeyError as exc:
                 raise DeviceNotInitializedYetException(event) from exc
+            # events of a product are processed in order, a slow handler does not hold back other products
+            coalesce_key = event.data.get(MessageField.NAME.value, None) if event.type == EventNameToHandler.property_changed.value else None
+            self.event_dispatcher.dispatch(product.serial_no, product.process_event, event, coalesce_key=coalesce_key)
         elif event.data[MessageField.SOURCE.value] in [EventSourceType.driver.name, EventSourceType.server.name]:
             # handle driver or server specific events locally
             await self._process_driver_event(event)
         else:
             raise UnknownEventSourceException(event)
 
+    async def _handle_livestream_data(self, event_data: dict):
+        event: Event = Event(type=event_data[IncomingMessageType.event.name], data=event_data)
+        try:
+            camera = self._devices[event_data[MessageField.SERIAL_NO.value]]
+        except (KeyError, TypeError) as exc:
+            raise DeviceNotInitializedYetException(event) from exc
+        if self.event_dispatcher.is_idle(camera.serial_no) is True:
+            await camera.process_livestream_data(event)
+        else:
+            # keep order with pending livestream started or stopped events of camera
+            self.event_dispatcher.dispatch(camera.serial_no, camera.process_livestream_data, event, droppable=True)
+
     async def _process_driver_event(self, event: Event):
         """Process driver level events"""
         if event.type == EventNameToHandler.captcha_request.value:
@@ -322,38 +590,160 @@ class ApiClient:
         if event.type == EventNameToHandler.verify_code.value:
             self._mfa_future.set_result(event)
 
+    async def _on_stream_message(self, message: dict) -> None:
+        if message[MessageField.TYPE.value] == IncomingMessageType.event.name:
+            event_data = message[IncomingMessageType.event.name]
+            if event_data[IncomingMessageType.event.name] in LIVESTREAM_DATA_EVENTS:
+                await self._handle_livestream_data(event_data)
+                return
+            if event_data[IncomingMessageType.event.name] in STREAM_CONNECTION_EVENTS:
+                await self._handle_event(Event(type=event_data[IncomingMessageType.event.name], data=event_data))
+            # other events are received over control connection as well
+            return
+        await self._on_message(message)
+
+    def _on_stream_close(self, future="") -> None:
+        _LOGGER.debug("on_stream_close - executed, it will be connected again on next livestream start")
+        self._fail_commands_in_flight(self._stream_message_ids)
+        # add-on does not send livestream data of closed connection anymore, cameras would wait for frames forever
+        for serial_no in self._stream_serial_nos:
+            camera = (self._devices or {}).get(serial_no, None)
+            if isinstance(camera, Camera):
+                camera.abort_livestream()
+        self._stream_serial_nos.clear()
+
     async def _on_open(self) -> None:
         _LOGGER.debug("on_open - executed")
 
     def _on_close(self, future="") -> None:
-        _LOGGER.debug(f"on_close - executed - {future} = {future.exception()}")
-        if self._on_error_callback is not None:
+        exception = None if future.cancelled() else future.exception()
+        _LOGGER.debug(f"on_close - executed - {future} = {exception}")
+        self._fail_commands_in_flight()
+        if self._on_error_callback is None:
+            # disconnect is requested
+            return
+
+        if self._discovered is False:
+            # products are not discovered yet, let integration set up again
             self._on_error_callback(future)
-        if future.exception() is not None:
-            _LOGGER.debug(f"on_close - executed - {future.exception()}")
-            raise future.exception()
+            return
+
+        # entities turn unavailable until connection is restored
+        for serial_no in list(self._devices) + list(self._stations):
+            self.state_update_registry.notify_product(serial_no)
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        attempt = 0
+        try:
+            while True:
+                # exponential backoff with jitter, so many clients do not hit add-on at once after its restart
+                delay = min(RECONNECT_MAX_SECONDS, RECONNECT_MIN_SECONDS * 2**attempt)
+                delay = delay / 2 + random.uniform(0, delay / 2)
+                _LOGGER.info(f"_reconnect - attempt {attempt + 1} in {delay:.1f} seconds")
+                await asyncio.sleep(delay)
+                attempt = attempt + 1
+                try:
+                    # update existing products in place, entities stay bound to them
+                    self._restored = True
+                    await self.connect()
+                    break
+                except (CaptchaRequiredException, MultiFactorCodeRequiredException) as exc:
+                    # user interaction is required, fall back to set up integration again
+                    self._on_error_callback(exc)
+                    return
+                except (WebSocketConnectionException, DriverNotConnectedException, FailedCommandException, asyncio.TimeoutError) as exc:
+                    _LOGGER.debug(f"_reconnect - attempt {attempt} failed - {exc}")
+                except Exception:  # pylint: disable=broad-except
+                    # keep retrying, leaving the loop would keep integration disconnected for good
+                    _LOGGER.exception(f"_reconnect - attempt {attempt} failed unexpectedly")
+        finally:
+            self._reconnect_task = None
+
+        _LOGGER.info(f"_reconnect - reconnected after {attempt} attempts")
+        if self.reload_required is True:
+            _LOGGER.info("_reconnect - products changed while disconnected, reloading")
+            self._on_error_callback(None)
 
     async def _on_error(self, error: str) -> None:
         _LOGGER.error(f"on_error - {error}")
         raise WebSocketConnectionException(error)
 
-    async def _send_message_get_response(self, message: OutgoingMessage) -> dict:
-        future: "asyncio.Future[dict]" = asyncio.get_event_loop().create_future()
-        self._result_futures[message.id] = future
-        await self.send_message(message.content)
+    async def _send_message_get_response(self, message: OutgoingMessage, client: WebSocketClient = None) -> dict:
+        # bulk traffic waits here, so control commands reach add-on first
+        priority = message.priority
+        await self.command_scheduler.acquire(priority)
+        start = time.monotonic()
+        round_trip = None
         try:
-            return await future
+            future: "asyncio.Future[dict]" = asyncio.get_event_loop().create_future()
+            self._result_futures[message.id] = future
+            if client is not None and client is self._stream_client:
+                self._stream_message_ids.add(message.id)
+            self._notify_statistic(StatisticName.commands_in_flight)
+            await self.send_message(message.content, client)
+            result = await asyncio.wait_for(future, message.timeout)
+            round_trip = time.monotonic() - start
+            return result
+        except asyncio.TimeoutError as exc:
+            self.command_timeouts = self.command_timeouts + 1
+            self._notify_statistic(StatisticName.command_timeouts)
+            _LOGGER.warning(f"command timed out - {message.command} - {message.timeout} seconds, {self.commands_in_flight - 1} other commands in flight")
+            raise CommandTimeoutException(message.command, message.timeout) from exc
         finally:
-            self._result_futures.pop(message.id)
-
-    async def send_message(self, message: dict) -> None:
+            self._result_futures.pop(message.id, None)
+            self._stream_message_ids.discard(message.id)
+            self.command_scheduler.release(priority, round_trip)
+            self._notify_statistic(StatisticName.commands_in_flight)
+
+    def _fail_commands_in_flight(self, message_ids=None) -> None:
+        # responses will never arrive over closed connection
+        for message_id, future in self._result_futures.items():
+            if not future.done() and (message_ids is None or message_id in message_ids):
+                future.set_exception(WebSocketConnectionException("Connection to add-on was closed"))
+
+    def _on_dispatcher_statistics(self) -> None:
+        self._notify_statistic(StatisticName.event_backlog_peak)
+        self._notify_statistic(StatisticName.dropped_events)
+
+    def _notify_statistic(self, statistic: StatisticName) -> None:
+        # statistics change with every command, entities are written at most once per interval
+        self._changed_statistics.add(statistic)
+        if self._statistics_timer is None:
+            self._statistics_timer = asyncio.get_running_loop().call_later(CLIENT_STATISTICS_INTERVAL_SECONDS, self._flush_statistics)
+
+    def _flush_statistics(self) -> None:
+        self._statistics_timer = None
+        changed, self._changed_statistics = self._changed_statistics, set()
+        if self._statistics_serial_no is None:
+            return
+        for statistic in changed:
+            self.state_update_registry.notify_property(self._statistics_serial_no, statistic.name)
+
+    async def send_message(self, message: dict, client: WebSocketClient = None) -> None:
         """send message to websocket api"""
         _LOGGER.debug(f"send_message - {message}")
-        await self._client.send_message(json.dumps(message))
+        await (client or self._client).send_json(message)
 
     async def disconnect(self):
         """Disconnect the web socket and destroy it"""
         self._on_error_callback = None
+        self.state_update_registry.close()
+        if self._statistics_timer is not None:
+            self._statistics_timer.cancel()
+            self._statistics_timer = None
+        for task in list(self._revalidation_tasks):
+            task.cancel()
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        await self.event_dispatcher.close()
+        for device in (self._devices or {}).values():
+            if isinstance(device, Camera):
+                device.close()
+        if self._stream_client is not None:
+            await self._stream_client.disconnect()
+            self._stream_client = None
         await self._client.disconnect()
         self._client = None
 
@@ -4,19 +4,26 @@ from enum import Enum
 import logging
 import threading
 from base64 import b64decode
-from collections import deque
 import datetime
 import traceback
 
-from .const import MessageField, STREAM_TIMEOUT_SECONDS, STREAM_SLEEP_SECONDS, GO2RTC_RTSP_PORT
+from .codec import to_byte_view
+from .const import EventNameToHandler, MessageField, STREAM_TIMEOUT_SECONDS, STREAM_SLEEP_SECONDS, GO2RTC_RTSP_PORT, VIDEO_STATISTICS_INTERVAL_SECONDS
 from .event import Event
 from .exceptions import CameraRTSPStreamNotEnabled, CameraRTSPStreamNotSupported
+from .frame_queue import FrameQueue
+from .nal import H264, GopCache
 from .p2p_streamer import P2PStreamer
 from .product import Device
+from .snapshot import SnapshotEngine
 from .util import wait_for_value
+from .video_buffer import VideoFrameBuffer
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# camera attributes presented as sensors, refreshed periodically while streaming
+VIDEO_STATISTICS = ("video_buffer_level", "video_dropped_frames", "video_dropped_bytes", "audio_queue_size")
+
 
 class StreamStatus(Enum):
     """Stream status"""
@@ -53,8 +60,12 @@ class Camera(Device):
         self.stream_provider: StreamProvider = None
         self.stream_url: str = None
 
-        self.video_queue = deque()
-        self.audio_queue = deque()
+        # buffer of current go2rtc push, replaced by a primed consumer on every start
+        self.video_queue = VideoFrameBuffer()
+        self.video_consumers: list[VideoFrameBuffer] = []
+        self.gop_cache = GopCache()
+        self.snapshot = SnapshotEngine(self)
+        self.audio_queue = FrameQueue()
         self.config = config
         self.voices = voices
         self.image_last_updated = None
@@ -73,6 +84,7 @@ class Camera(Device):
         self.rtsp_started_event = asyncio.Event()
 
         self.stream_debug = None
+        self._video_statistics_timer: asyncio.TimerHandle = None
 
     @property
     def is_streaming(self) -> bool:
@@ -87,9 +99,22 @@ class Camera(Device):
     async def _handle_livestream_stopped(self, event: Event):
         # automatically find this function for respective event
         _LOGGER.debug(f"_handle_livestream_stopped - {event}")
-        self.stream_status = StreamStatus.IDLE
-        self.video_queue = deque()
-        self.audio_queue = deque()
+        self._reset_livestream()
+
+    def _reset_livestream(self) -> None:
+        self._set_stream_status(StreamStatus.IDLE)
+        for consumer in self.video_consumers:
+            consumer.clear()
+        self.gop_cache.clear()
+        self.audio_queue.clear()
+
+    def abort_livestream(self) -> None:
+        """Stop livestream locally when its add-on connection is lost, without waiting for livestream stopped event"""
+        _LOGGER.debug(f"abort_livestream - {self.serial_no}")
+        self.p2p_streamer.retry = False
+        if self.stream_future is not None:
+            self.stream_future.cancel()
+        self._reset_livestream()
 
     async def _handle_rtsp_livestream_started(self, event: Event):
         # automatically find this function for respective event
@@ -99,19 +124,78 @@ class Camera(Device):
     async def _handle_rtsp_livestream_stopped(self, event: Event):
         # automatically find this function for respective event
         _LOGGER.debug(f"_handle_rtsp_livestream_stopped - {event}")
-        self.stream_status = StreamStatus.IDLE
+        self._set_stream_status(StreamStatus.IDLE)
 
     async def _handle_livestream_video_data_received(self, event: Event):
         #_LOGGER.debug(f"_handle_rtsp_livestream_stopped - {event}")
-        self.video_queue.append(bytearray(event.data["buffer"]["data"]))
+        frame = to_byte_view(event.data[MessageField.BUFFER.value][MessageField.DATA.value])
+        codec = event.data.get(MessageField.METADATA.value, {}).get(MessageField.VIDEO_CODEC.value, H264)
+        keyframe = self.gop_cache.add(frame, codec)
+        for consumer in self.video_consumers:
+            consumer.put(frame, keyframe)
 
     async def _handle_livestream_audio_data_received(self, event: Event):
         pass
         #self.audio_queue.append(bytearray(event.data["buffer"]["data"]))
 
+    async def process_livestream_data(self, event: Event):
+        """Act on received livestream data without notifying state listeners"""
+        if event.type == EventNameToHandler.livestream_video_data_received.value:
+            await self._handle_livestream_video_data_received(event)
+        else:
+            await self._handle_livestream_audio_data_received(event)
+
+    def add_video_consumer(self) -> VideoFrameBuffer:
+        """Attach a new video consumer, primed with frames from last keyframe so it can start decoding immediately"""
+        consumer = VideoFrameBuffer()
+        for index, frame in enumerate(self.gop_cache.frames):
+            consumer.put(frame, index == 0)
+        self.video_consumers.append(consumer)
+        return consumer
+
+    def remove_video_consumer(self, consumer: VideoFrameBuffer) -> None:
+        """Detach video consumer"""
+        with contextlib.suppress(ValueError):
+            self.video_consumers.remove(consumer)
+
+    def _set_stream_status(self, stream_status: StreamStatus) -> None:
+        if stream_status == self.stream_status:
+            return
+        self.stream_status = stream_status
+        self.api.state_update_registry.notify_property(self.serial_no, "stream_status")
+        if stream_status == StreamStatus.STREAMING:
+            if self._video_statistics_timer is None:
+                self._schedule_video_statistics()
+        elif stream_status == StreamStatus.IDLE:
+            self._cancel_video_statistics()
+            # buffers were cleared, present final values
+            self._notify_video_statistics()
+
+    def _schedule_video_statistics(self) -> None:
+        self._video_statistics_timer = asyncio.get_running_loop().call_later(VIDEO_STATISTICS_INTERVAL_SECONDS, self._on_video_statistics_timer)
+
+    def _on_video_statistics_timer(self) -> None:
+        self._notify_video_statistics()
+        self._schedule_video_statistics()
+
+    def _cancel_video_statistics(self) -> None:
+        if self._video_statistics_timer is not None:
+            self._video_statistics_timer.cancel()
+            self._video_statistics_timer = None
+
+    def _notify_video_statistics(self) -> None:
+        # buffer counters change with every frame, so they are pushed on a timer instead of per frame
+        for name in VIDEO_STATISTICS:
+            self.api.state_update_registry.notify_property(self.serial_no, name)
+
+    def close(self) -> None:
+        """Stop statistics timer and snapshot decoder"""
+        self._cancel_video_statistics()
+        self.snapshot.close()
+
     async def _initiate_start_stream(self, stream_type) -> bool:
         self.set_stream_provider(stream_type)
-        self.stream_status = StreamStatus.PREPARING
+        self._set_stream_status(StreamStatus.PREPARING)
         self.stream_debug = "info - send command to add-on"
         _LOGGER.debug(f"_initiate_start_stream - {self.stream_debug} - {stream_type}")
         event = None
@@ -155,7 +239,7 @@ class Camera(Device):
             return False
         self.stream_future = asyncio.create_task(self.p2p_streamer.start())
         self.stream_checker = asyncio.create_task(self._check_live_stream())
-        self.stream_status = StreamStatus.STREAMING
+        self._set_stream_status(StreamStatus.STREAMING)
         return True
 
     async def stop_livestream(self, is_internal=False):
@@ -172,7 +256,7 @@ class Camera(Device):
         if await self._initiate_start_stream(StreamProvider.RTSP) is False:
             return False
 
-        self.stream_status = StreamStatus.STREAMING
+        self._set_stream_status(StreamStatus.STREAMING)
         return True
 
 
@@ -270,8 +354,9 @@ class Camera(Device):
         _LOGGER.debug(f"url - {self.stream_provider} - {self.stream_url}")
 
     async def _handle_property_changed(self, event: Event):
-        await super()._handle_property_changed(event)
-        _LOGGER.debug(f"camera _handle_property_changed - {event.data[MessageField.NAME.value] }")
+        changed = await super()._handle_property_changed(event)
+        _LOGGER.debug(f"camera _handle_property_changed - {event.data[MessageField.NAME.value] } - {changed}")
 
-        if event.data[MessageField.NAME.value] == MessageField.PICTURE.value:
+        if changed is True and event.data[MessageField.NAME.value] == MessageField.PICTURE.value:
             self.image_last_updated = datetime.datetime.now(datetime.timezone.utc)
+        return changed
@@ -0,0 +1,174 @@
+"""Module to encode and decode websocket messages"""
+from __future__ import annotations
+
+from enum import Enum
+import json
+import logging
+import re
+import struct
+from typing import Any
+
+from .const import LIVESTREAM_DATA_EVENTS, EventNameToHandler, EventSourceType, MessageField
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# message type and event name are serialized before any payload, so they can be read from the head of the frame
+PEEK_LENGTH = 256
+TYPE_PATTERN = re.compile(r'"type"\s*:\s*"([^"]*)"')
+EVENT_PATTERN = re.compile(r'"event"\s*:\s*"([^"]*)"')
+BUFFER_DATA_PATTERN = re.compile(r'"buffer"\s*:\s*\{\s*"type"\s*:\s*"Buffer"\s*,\s*"data"\s*:\s*\[')
+
+# binary livestream frame header: version, stream kind, codec, serial number length, timestamp in milliseconds
+BINARY_HEADER = struct.Struct("!BBBBQ")
+BINARY_HEADER_VERSION = 1
+
+
+class BinaryStreamKind(Enum):
+    """Stream kind of binary livestream frame to event name"""
+
+    video = EventNameToHandler.livestream_video_data_received.value
+    audio = EventNameToHandler.livestream_audio_data_received.value
+
+
+class BinaryCodec(Enum):
+    """Codec identifier of binary livestream frame"""
+
+    H264 = 0
+    H265 = 1
+    AAC = 2
+
+
+BINARY_STREAM_KINDS = list(BinaryStreamKind)
+
+
+class JsonCodec:
+    """Codec based on standard library json module"""
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode json document"""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """Encode object into json document"""
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec based on orjson module"""
+
+    name = "orjson"
+
+    def loads(self, data: str | bytes) -> Any:
+        """Decode json document"""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """Encode object into json document"""
+        return orjson.dumps(obj).decode()
+
+
+class MessageCodec:
+    """Websocket message codec with cheap peeking and direct decoding of livestream payloads into bytes"""
+
+    def __init__(self, codec: JsonCodec = None) -> None:
+        self.codec: JsonCodec = codec or get_default_json_codec()
+
+    @property
+    def name(self) -> str:
+        """Name of underlying json codec"""
+        return self.codec.name
+
+    def peek(self, raw: str) -> tuple[str | None, str | None]:
+        """Return message type and event name without decoding whole message"""
+        head = raw[0:PEEK_LENGTH]
+        message_type = TYPE_PATTERN.search(head)
+        if message_type is None:
+            return None, None
+        event_name = EVENT_PATTERN.search(head, message_type.end())
+        return message_type.group(1), None if event_name is None else event_name.group(1)
+
+    def decode(self, raw: str | bytes) -> dict:
+        """Decode incoming message, livestream payloads are decoded into bytes"""
+        if isinstance(raw, str):
+            message_type, event_name = self.peek(raw)
+            if message_type == MessageField.EVENT.value and event_name in LIVESTREAM_DATA_EVENTS:
+                message = self._decode_livestream_data(raw)
+                if message is not None:
+                    return message
+        return self.codec.loads(raw)
+
+    def decode_binary(self, raw: bytes) -> dict:
+        """Decode binary livestream frame into livestream data event without copying payload"""
+        view = memoryview(raw)
+        version, stream_kind, codec, serial_no_length, timestamp = BINARY_HEADER.unpack_from(view)
+        if version != BINARY_HEADER_VERSION:
+            raise ValueError(f"Unsupported binary frame version {version}")
+        serial_no_end = BINARY_HEADER.size + serial_no_length
+        stream_kind = BINARY_STREAM_KINDS[stream_kind]
+        codec_name = BinaryCodec(codec).name
+        metadata_key = "videoCodec" if stream_kind == BinaryStreamKind.video else "audioCodec"
+        return {
+            MessageField.TYPE.value: MessageField.EVENT.value,
+            MessageField.EVENT.value: {
+                MessageField.SOURCE.value: EventSourceType.device.name,
+                MessageField.EVENT.value: stream_kind.value,
+                MessageField.SERIAL_NO.value: bytes(view[BINARY_HEADER.size : serial_no_end]).decode(),
+                MessageField.BUFFER.value: {MessageField.TYPE.value: "Buffer", MessageField.DATA.value: view[serial_no_end:]},
+                "metadata": {metadata_key: codec_name, "timestamp": timestamp},
+            },
+        }
+
+    def encode(self, message: Any) -> str:
+        """Encode outgoing message"""
+        return self.codec.dumps(message)
+
+    def _decode_livestream_data(self, raw: str) -> dict | None:
+        match = BUFFER_DATA_PATTERN.search(raw)
+        if match is None:
+            return None
+        start = match.end()
+        end = raw.find("]", start)
+        if end == -1:
+            return None
+
+        message = self.codec.loads(raw[0 : start - 1] + "null" + raw[end + 1 :])
+        try:
+            buffer = message[MessageField.EVENT.value][MessageField.BUFFER.value]
+        except (KeyError, TypeError):
+            return None
+        buffer[MessageField.DATA.value] = self.decode_byte_array(raw[start:end])
+        return message
+
+    def decode_byte_array(self, content: str) -> memoryview:
+        """Convert comma separated integer list into contiguous buffer in one step"""
+        return memoryview(bytes(self.codec.loads("[" + content + "]")))
+
+
+def encode_binary(serial_no: str, stream_kind: BinaryStreamKind, codec: BinaryCodec, timestamp: int, payload: bytes) -> bytes:
+    """Build binary livestream frame, counterpart of MessageCodec.decode_binary"""
+    serial_no = serial_no.encode()
+    header = BINARY_HEADER.pack(BINARY_HEADER_VERSION, BINARY_STREAM_KINDS.index(stream_kind), codec.value, len(serial_no), timestamp)
+    return header + serial_no + bytes(payload)
+
+
+def to_byte_view(data: bytes | bytearray | memoryview | list) -> memoryview:
+    """Return memoryview over payload, converting integer lists only once"""
+    if isinstance(data, memoryview):
+        return data
+    if isinstance(data, (bytes, bytearray)):
+        return memoryview(data)
+    return memoryview(bytes(data))
+
+
+def get_default_json_codec() -> JsonCodec:
+    """Return fastest available json codec"""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JsonCodec()
@@ -0,0 +1,124 @@
+"""Module to order outgoing commands by priority"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import logging
+import time
+
+from .const import COMMAND_LANE_SIZE, COMMAND_WINDOW, CommandPriority
+from .exceptions import CommandQueueFullException
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+@dataclass
+class LaneStatistics:
+    """Counters and latencies of a priority lane, latencies in milliseconds"""
+
+    sent: int = 0
+    rejected: int = 0
+    queued: int = 0
+    wait_total: float = 0
+    wait_max: float = 0
+    round_trip_total: float = 0
+    round_trip_max: float = 0
+
+    @property
+    def wait_mean(self) -> float:
+        """Mean time spent in lane before sending"""
+        return self.wait_total / self.sent if self.sent else 0
+
+    @property
+    def round_trip_mean(self) -> float:
+        """Mean time from sending to response"""
+        return self.round_trip_total / self.sent if self.sent else 0
+
+    def as_dict(self) -> dict:
+        """Rounded values for presentation"""
+        return {
+            "sent": self.sent,
+            "rejected": self.rejected,
+            "queued": self.queued,
+            "wait_mean_ms": round(self.wait_mean, 1),
+            "wait_max_ms": round(self.wait_max, 1),
+            "round_trip_mean_ms": round(self.round_trip_mean, 1),
+            "round_trip_max_ms": round(self.round_trip_max, 1),
+        }
+
+
+class CommandScheduler:
+    """Admit commands to add-on by priority, bulk queries wait in bounded lanes while interactive control goes first"""
+
+    def __init__(self, window: int = COMMAND_WINDOW, lane_size: int = COMMAND_LANE_SIZE) -> None:
+        self.window = window
+        self.lane_size = lane_size
+        self.in_flight = 0
+        self._lanes: dict[CommandPriority, deque[asyncio.Future]] = {priority: deque() for priority in CommandPriority}
+        self.statistics: dict[CommandPriority, LaneStatistics] = {priority: LaneStatistics() for priority in CommandPriority}
+
+    async def acquire(self, priority: CommandPriority) -> None:
+        """Wait until command of given priority may be sent"""
+        statistics = self.statistics[priority]
+        if self._can_send(priority) is True:
+            self.in_flight = self.in_flight + 1
+            self._admit(priority, 0)
+            return
+
+        lane = self._lanes[priority]
+        if len(lane) >= self.lane_size:
+            statistics.rejected = statistics.rejected + 1
+            raise CommandQueueFullException(priority.name, self.lane_size)
+
+        waiter = asyncio.get_running_loop().create_future()
+        lane.append(waiter)
+        statistics.queued = len(lane)
+        start = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # admitted while caller was cancelled, pass slot on
+                self.release(priority, None)
+            else:
+                lane.remove(waiter)
+                statistics.queued = len(lane)
+            raise
+        self._admit(priority, (time.monotonic() - start) * 1000)
+
+    def release(self, priority: CommandPriority, round_trip: float | None) -> None:
+        """Free slot of completed command, round trip in seconds, and admit waiting commands"""
+        self.in_flight = self.in_flight - 1
+        if round_trip is not None:
+            statistics = self.statistics[priority]
+            statistics.round_trip_total = statistics.round_trip_total + round_trip * 1000
+            statistics.round_trip_max = max(statistics.round_trip_max, round_trip * 1000)
+        self._dispatch()
+
+    def _can_send(self, priority: CommandPriority) -> bool:
+        if priority == CommandPriority.interactive:
+            # control commands are never held back by bulk traffic
+            return True
+        if self.in_flight >= self.window:
+            return False
+        # keep order with already waiting commands of same or higher priority
+        return not any(self._lanes[lane] for lane in CommandPriority if lane.value <= priority.value)
+
+    def _admit(self, priority: CommandPriority, wait: float) -> None:
+        statistics = self.statistics[priority]
+        statistics.sent = statistics.sent + 1
+        statistics.wait_total = statistics.wait_total + wait
+        statistics.wait_max = max(statistics.wait_max, wait)
+
+    def _dispatch(self) -> None:
+        for priority in CommandPriority:
+            lane = self._lanes[priority]
+            while lane and (priority == CommandPriority.interactive or self.in_flight < self.window):
+                waiter = lane.popleft()
+                self.statistics[priority].queued = len(lane)
+                if waiter.done():
+                    continue
+                # slot is taken on behalf of waiter
+                self.in_flight = self.in_flight + 1
+                waiter.set_result(None)
@@ -0,0 +1,93 @@
+"""Module to measure websocket compression trade-off"""
+from __future__ import annotations
+
+import logging
+import time
+import zlib
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# aiohttp negotiates permessage-deflate window bits, 0 disables compression
+COMPRESSION_DISABLED = 0
+COMPRESSION_WINDOW_BITS = range(9, 16)
+PROBE_WINDOW_BITS = (0, 9, 12, 15)
+PROBE_REPORT_SECONDS = 60
+
+
+def get_window_bits(value: int | None, default: int) -> int:
+    """Validate configured compression, window bits between 9 and 15 or 0 to disable"""
+    if value is None:
+        return default
+    if value == COMPRESSION_DISABLED or value in COMPRESSION_WINDOW_BITS:
+        return value
+    _LOGGER.warning(f"invalid websocket compression {value}, expected 0 or 9 to 15, using {default}")
+    return default
+
+
+class _ProbeChannel:
+    """Deflate and inflate context of one candidate window size, kept across messages like permessage-deflate does"""
+
+    def __init__(self, window_bits: int) -> None:
+        self.window_bits = window_bits
+        self.wire_bytes = 0
+        self.deflate_seconds = 0.0
+        self.inflate_seconds = 0.0
+        if window_bits != COMPRESSION_DISABLED:
+            self._compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -window_bits)
+            self._decompressor = zlib.decompressobj(-window_bits)
+
+    def record(self, payload: bytes) -> None:
+        if self.window_bits == COMPRESSION_DISABLED:
+            self.wire_bytes = self.wire_bytes + len(payload)
+            return
+        start = time.thread_time()
+        compressed = self._compressor.compress(payload) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        self.deflate_seconds = self.deflate_seconds + time.thread_time() - start
+        start = time.thread_time()
+        self._decompressor.decompress(compressed)
+        self.inflate_seconds = self.inflate_seconds + time.thread_time() - start
+        self.wire_bytes = self.wire_bytes + len(compressed)
+
+
+class CompressionProbe:
+    """Measurement mode, reports bytes on the wire and CPU time of received messages for candidate compression settings"""
+
+    def __init__(self, name: str, window_bits: int) -> None:
+        self.name = name
+        self.window_bits = window_bits
+        self.messages = 0
+        self.payload_bytes = 0
+        self.handling_seconds = 0.0
+        self._channels = [_ProbeChannel(bits) for bits in PROBE_WINDOW_BITS]
+        self._last_report = time.monotonic()
+
+    def record(self, payload: bytes | str, handling_seconds: float) -> None:
+        """Account received payload and CPU time spent to decode and handle it"""
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self.messages = self.messages + 1
+        self.payload_bytes = self.payload_bytes + len(payload)
+        self.handling_seconds = self.handling_seconds + handling_seconds
+        for channel in self._channels:
+            channel.record(payload)
+        if time.monotonic() - self._last_report >= PROBE_REPORT_SECONDS:
+            self._last_report = time.monotonic()
+            _LOGGER.info(f"compression probe - {self.name} - {self.report()}")
+
+    def report(self) -> dict:
+        """Totals per candidate window bits, CPU times in milliseconds"""
+        return {
+            "window_bits": self.window_bits,
+            "messages": self.messages,
+            "payload_bytes": self.payload_bytes,
+            "handling_ms": round(self.handling_seconds * 1000, 1),
+            "candidates": {
+                channel.window_bits: {
+                    "wire_bytes": channel.wire_bytes,
+                    "ratio": round(channel.wire_bytes / self.payload_bytes, 3) if self.payload_bytes else 1,
+                    "deflate_ms": round(channel.deflate_seconds * 1000, 1),
+                    "inflate_ms": round(channel.inflate_seconds * 1000, 1),
+                }
+                for channel in self._channels
+            },
+        }
@@ -15,6 +15,20 @@ STREAM_SLEEP_SECONDS = 0.25
 GO2RTC_RTSP_PORT = 8554
 GO2RTC_API_PORT = 1984
 GO2RTC_API_URL = "http://{0}:{1}/api/stream"
+VIDEO_BUFFER_MAX_BYTES = 8 * 1024 * 1024
+VIDEO_STATISTICS_INTERVAL_SECONDS = 5
+CLIENT_STATISTICS_INTERVAL_SECONDS = 5
+DISCOVERY_CONCURRENCY = 4
+COMMAND_WINDOW = 8
+# permessage-deflate window bits, frames are already compressed video so deflating them only costs CPU on both ends
+CONTROL_CONNECTION_COMPRESSION = 9
+STREAM_CONNECTION_COMPRESSION = 0
+DISPATCH_MAILBOX_SIZE = 1000
+COMMAND_LANE_SIZE = 256
+RECONNECT_MIN_SECONDS = 1
+RECONNECT_MAX_SECONDS = 120
+# large or short lived properties are not persisted for warm start
+WARM_START_SKIPPED_PROPERTIES = frozenset(["picture"])
 
 
 class MessageField(Enum):
@@ -80,6 +94,11 @@ class MessageField(Enum):
     LIVE_STREAMING = "livestreaming"
     VOICES = "voices"
     VOICE_ID = "voiceId"
+    EVENT = "event"
+    BUFFER = "buffer"
+    DATA = "data"
+    METADATA = "metadata"
+    VIDEO_CODEC = "videoCodec"
 
     # snooze
     SNOOZE_TIME = "snoozeTime"
@@ -112,6 +131,22 @@ class EventNameToHandler(Enum):
     connection_error = "connection error"
 
 
+LIVESTREAM_DATA_EVENTS = frozenset(
+    {
+        EventNameToHandler.livestream_video_data_received.value,
+        EventNameToHandler.livestream_audio_data_received.value,
+    }
+)
+
+# add-on sends these only to connection which started livestream, everything else is received over control connection
+STREAM_CONNECTION_EVENTS = LIVESTREAM_DATA_EVENTS | frozenset(
+    {
+        EventNameToHandler.livestream_started.value,
+        EventNameToHandler.livestream_stopped.value,
+    }
+)
+
+
 class ProductType(Enum):
     """Product type"""
 
@@ -128,6 +163,23 @@ class PropertyType(Enum):
     object = "object"
 
 
+class CommandPriority(Enum):
+    """Outgoing command priority, lower value is sent first"""
+
+    interactive = 0
+    streaming = 1
+    bulk = 2
+
+
+class StatisticName(Enum):
+    """Client statistics presented on one station"""
+
+    commands_in_flight = "Commands In Flight"
+    command_timeouts = "Command Timeouts"
+    event_backlog_peak = "Event Backlog Peak"
+    dropped_events = "Dropped Events"
+
+
 class ProductCommand(Enum):
     """Important Product Commands - Product function to description+remote command"""
 
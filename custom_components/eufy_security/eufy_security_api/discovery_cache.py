@@ -0,0 +1,81 @@
+"""Module to keep product discovery results between restarts"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+SOFTWARE_VERSION = "software_version"
+METADATA = "metadata"
+COMMANDS = "commands"
+PRODUCT_TYPE = "product_type"
+PROPERTIES = "properties"
+EXTRAS = "extras"
+
+
+class DiscoveryCache:
+    """Property metadata and commands of products, valid as long as firmware version does not change"""
+
+    def __init__(self, save_callback: Callable[[dict], None] = None) -> None:
+        self.save_callback = save_callback
+        self._data: dict[str, dict] = {}
+
+    def load(self, data: dict | None) -> None:
+        """Load previously persisted cache content"""
+        self._data = data or {}
+        _LOGGER.debug(f"discovery cache loaded - {len(self._data)} products")
+
+    def has(self, serial_no: str) -> bool:
+        """Checks if there is any cached entry for product"""
+        return serial_no in self._data
+
+    def get(self, serial_no: str, software_version: str) -> tuple[dict, list] | None:
+        """Return cached metadata and commands if they belong to given firmware version"""
+        entry = self._data.get(serial_no, None)
+        if entry is None or entry[SOFTWARE_VERSION] != software_version:
+            return None
+        return dict(entry[METADATA]), list(entry[COMMANDS])
+
+    def set(self, serial_no: str, software_version: str, metadata: dict, commands: list) -> bool:
+        """Store metadata and commands of product, return True if cache content changed"""
+        definition = {SOFTWARE_VERSION: software_version, METADATA: dict(metadata), COMMANDS: list(commands)}
+        entry = self._data.get(serial_no, {})
+        if all(entry.get(key, None) == value for key, value in definition.items()):
+            return False
+        self._data[serial_no] = {**entry, **definition}
+        self.save()
+        return True
+
+    def set_state(self, serial_no: str, product_type: str, properties: dict, extras: dict) -> None:
+        """Store last known property values of product, used to create entities before connecting"""
+        entry = self._data.get(serial_no, None)
+        if entry is None:
+            return
+        entry[PRODUCT_TYPE] = product_type
+        entry[PROPERTIES] = dict(properties)
+        entry[EXTRAS] = dict(extras)
+        self.save()
+
+    def get_states(self) -> dict[str, tuple[str, dict, dict, list, dict]]:
+        """Return product type, properties, metadata, commands and extras of products with known state"""
+        states = {}
+        for serial_no, entry in self._data.items():
+            if PROPERTIES not in entry:
+                continue
+            states[serial_no] = (entry[PRODUCT_TYPE], dict(entry[PROPERTIES]), dict(entry[METADATA]), list(entry[COMMANDS]), dict(entry[EXTRAS]))
+        return states
+
+    def retain(self, serial_nos: list[str]) -> None:
+        """Drop products which are not on account anymore"""
+        removed = [serial_no for serial_no in self._data if serial_no not in serial_nos]
+        if not removed:
+            return
+        for serial_no in removed:
+            self._data.pop(serial_no)
+        self.save()
+
+    def save(self) -> None:
+        """Persist cache content through save callback"""
+        if self.save_callback is not None:
+            self.save_callback(self._data)
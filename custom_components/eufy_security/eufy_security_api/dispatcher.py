@@ -0,0 +1,127 @@
+"""Module to process events of different products concurrently"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from .const import DISPATCH_MAILBOX_SIZE
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+@dataclass
+class MailboxStatistics:
+    """Counters of a product mailbox"""
+
+    processed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    peak: int = 0
+
+
+class EventDispatcher:
+    """Ordered per key mailboxes, each drained by its own worker so a slow handler only delays its own product"""
+
+    def __init__(self, mailbox_size: int = DISPATCH_MAILBOX_SIZE, statistics_callback: Callable[[], None] = None) -> None:
+        self.mailbox_size = mailbox_size
+        self.statistics_callback = statistics_callback
+        self.statistics: dict[str, MailboxStatistics] = {}
+        self._mailboxes: dict[str, deque] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    @property
+    def backlog(self) -> int:
+        """Number of queued calls over all mailboxes"""
+        return sum(len(mailbox) for mailbox in self._mailboxes.values())
+
+    @property
+    def peak(self) -> int:
+        """Highest backlog seen in a single mailbox"""
+        return max((statistics.peak for statistics in self.statistics.values()), default=0)
+
+    @property
+    def dropped(self) -> int:
+        """Number of calls dropped because mailbox was full"""
+        return sum(statistics.dropped for statistics in self.statistics.values())
+
+    def is_idle(self, key: str) -> bool:
+        """Checks if there is nothing queued or running for key, so a call can run inline without reordering"""
+        return key not in self._workers
+
+    def dispatch(self, key: str, handler: Callable[..., Coroutine[Any, Any, Any]], *args, droppable: bool = False, coalesce_key: str = None) -> None:
+        """Queue call for key, calls of same key run in order"""
+        # full mailbox drops livestream data first, then merges changes of same property, control events are always queued
+        mailbox = self._mailboxes.setdefault(key, deque())
+        statistics = self.statistics.setdefault(key, MailboxStatistics())
+        changed = False
+        call = (handler, args, droppable, coalesce_key)
+        if len(mailbox) >= self.mailbox_size:
+            changed = True
+            if droppable is True:
+                # newest frame is as good as oldest one, keep queued frames in order
+                statistics.dropped = statistics.dropped + 1
+                self._notify_statistics(changed)
+                return
+            if self._drop_oldest_droppable(mailbox) is True:
+                statistics.dropped = statistics.dropped + 1
+            elif coalesce_key is not None and self._coalesce(mailbox, call) is True:
+                statistics.coalesced = statistics.coalesced + 1
+                self._notify_statistics(changed)
+                return
+            else:
+                _LOGGER.warning(f"dispatcher - {key} - mailbox is full, queueing control event over limit")
+        mailbox.append(call)
+        if len(mailbox) > statistics.peak:
+            statistics.peak = len(mailbox)
+            changed = True
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._drain(key, mailbox))
+        self._notify_statistics(changed)
+
+    def _notify_statistics(self, changed: bool) -> None:
+        if changed is True and self.statistics_callback is not None:
+            self.statistics_callback()
+
+    @staticmethod
+    def _drop_oldest_droppable(mailbox: deque) -> bool:
+        for index, (_, _, droppable, _) in enumerate(mailbox):
+            if droppable is True:
+                del mailbox[index]
+                return True
+        return False
+
+    @staticmethod
+    def _coalesce(mailbox: deque, call: tuple) -> bool:
+        # latest queued change of same property is replaced in place, its value would be overwritten anyway
+        for index in range(len(mailbox) - 1, -1, -1):
+            if mailbox[index][3] == call[3]:
+                mailbox[index] = call
+                return True
+        return False
+
+    async def close(self) -> None:
+        """Stop workers and drop queued calls"""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers = {}
+        self._mailboxes = {}
+
+    async def _drain(self, key: str, mailbox: deque) -> None:
+        statistics = self.statistics[key]
+        try:
+            while mailbox:
+                handler, args, _, _ = mailbox.popleft()
+                try:
+                    await handler(*args)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(f"dispatcher - {key} - handler failed")
+                statistics.processed = statistics.processed + 1
+        finally:
+            self._workers.pop(key, None)
+
@@ -28,6 +28,24 @@ class WebSocketConnectionException(BaseEufySecurityException):
         super().__init__(msg)
 
 
+class CommandTimeoutException(WebSocketConnectionException):
+    """Add-on did not answer command in time"""
+
+    def __init__(self, command: str, timeout: float) -> None:
+        super().__init__(f"Add-on did not answer {command} in {timeout} seconds")
+        self.command = command
+        self.timeout = timeout
+
+
+class CommandQueueFullException(WebSocketConnectionException):
+    """Too many commands are waiting to be sent"""
+
+    def __init__(self, priority: str, size: int) -> None:
+        super().__init__(f"Too many {priority} commands are waiting for add-on, limit is {size}")
+        self.priority = priority
+        self.size = size
+
+
 class IncompatibleVersionException(BaseEufySecurityException):
     """Incompatible version exception."""
 
@@ -0,0 +1,42 @@
+"""Module to pass livestream frames from event handlers to stream writers"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class FrameQueue:
+    """Frame channel waking the consumer as soon as a frame arrives, producer and consumer run on the same loop"""
+
+    def __init__(self) -> None:
+        self._frames: deque = deque()
+        self._waiter: asyncio.Future = None
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put(self, frame) -> None:
+        """Append frame and wake up waiting consumer"""
+        self._frames.append(frame)
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if waiter.done() is False:
+                waiter.set_result(None)
+
+    def clear(self) -> None:
+        """Drop all queued frames"""
+        self._frames.clear()
+
+    async def get(self, timeout: float = None):
+        """Return next frame, wait until one arrives or raise asyncio.TimeoutError after timeout"""
+        while not self._frames:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(self._waiter, timeout)
+            finally:
+                self._waiter = None
+        return self._frames.popleft()
@@ -1,42 +1,97 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import logging
+import sys
+from typing import Any
+import weakref
 
 from .const import MessageField, PropertyType
-from typing import Any
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
-@dataclass
-class Metadata:
-    """Property Metadata"""
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class MetadataDefinition:
+    """Property definition, shared between products reporting the same one"""
 
     name: str
     label: str
     readable: bool
     writeable: bool
-    type: str
+    type: PropertyType
     unit: str
     min: int
     max: int
-    product: Any
-    command: str
-    states: dict = field(default_factory=dict)
+    command: Any
+    states: dict = None
+
+
+# products of same model report identical definitions, keep one instance while any product uses it
+_DEFINITIONS: "weakref.WeakValueDictionary[tuple, MetadataDefinition]" = weakref.WeakValueDictionary()
+
+
+def _definition_field(name: str) -> property:
+    return property(lambda self: getattr(self.definition, name))
+
+
+class Metadata:
+    """Property Metadata"""
+
+    __slots__ = ("definition", "product")
+
+    name: str = _definition_field("name")
+    label: str = _definition_field("label")
+    readable: bool = _definition_field("readable")
+    writeable: bool = _definition_field("writeable")
+    type: PropertyType = _definition_field("type")
+    unit: str = _definition_field("unit")
+    min: int = _definition_field("min")
+    max: int = _definition_field("max")
+    command: Any = _definition_field("command")
+    states: dict = _definition_field("states")
+
+    def __init__(self, definition: MetadataDefinition, product: Any) -> None:
+        self.definition = definition
+        self.product = product
+
+    def __repr__(self) -> str:
+        return f"Metadata(definition={self.definition}, product={getattr(self.product, 'serial_no', None)})"
 
     @classmethod
     def parse(cls, product: Any, data: dict):
         """generate Metadata from data dictionary"""
 
-        return cls(
-            name=data[MessageField.NAME.value],
-            label=data[MessageField.LABEL.value],
-            readable=data.get(MessageField.READABLE.value, True),
-            writeable=data.get(MessageField.WRITEABLE.value, False),
-            type=PropertyType[data.get(MessageField.TYPE.value, "string")],
-            unit=data.get(MessageField.UNIT.value, None),
-            min=data.get(MessageField.MIN.value, None),
-            max=data.get(MessageField.MAX.value, None),
-            product=product,
-            command=data.get(MessageField.COMMAND.value, None),
-            states=data.get(MessageField.STATES.value, None),
+        return cls(parse_definition(data), product)
+
+
+def parse_definition(data: dict) -> MetadataDefinition:
+    """Return shared definition for data dictionary"""
+    definition = MetadataDefinition(
+        name=sys.intern(data[MessageField.NAME.value]),
+        label=data[MessageField.LABEL.value],
+        readable=data.get(MessageField.READABLE.value, True),
+        writeable=data.get(MessageField.WRITEABLE.value, False),
+        type=PropertyType[data.get(MessageField.TYPE.value, "string")],
+        unit=data.get(MessageField.UNIT.value, None),
+        min=data.get(MessageField.MIN.value, None),
+        max=data.get(MessageField.MAX.value, None),
+        command=data.get(MessageField.COMMAND.value, None),
+        states=data.get(MessageField.STATES.value, None),
+    )
+    try:
+        # command descriptions are module level singletons, compare them by identity
+        key = (
+            definition.name,
+            definition.label,
+            definition.readable,
+            definition.writeable,
+            definition.type,
+            definition.unit,
+            definition.min,
+            definition.max,
+            None if definition.command is None else id(definition.command),
+            None if definition.states is None else tuple(definition.states.items()),
         )
+        return _DEFINITIONS.setdefault(key, definition)
+    except TypeError:
+        # unexpected unhashable value, do not share
+        return definition
@@ -0,0 +1,160 @@
+"""Module to inspect H.264/H.265 elementary stream frames"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+from .const import VIDEO_BUFFER_MAX_BYTES
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+START_CODE = b"\x00\x00\x01"
+LONG_START_CODE = b"\x00\x00\x00\x01"
+
+# parameter sets and first slice header are at the start of access unit, no need to copy slice data
+PROBE_LENGTH = 4096
+
+H264 = "H264"
+H265 = "H265"
+
+H264_NAL_IDR = 5
+H264_NAL_SPS = 7
+H264_NAL_PPS = 8
+H264_NAL_VCL = range(1, 6)
+H265_NAL_VCL = range(0, 32)
+H265_NAL_IRAP = range(16, 24)
+H265_NAL_VPS = 32
+H265_NAL_SPS = 33
+H265_NAL_PPS = 34
+
+
+@dataclass
+class NalUnit:
+    """NAL unit position inside frame"""
+
+    type: int
+    start: int
+    end: int
+
+
+@dataclass
+class FrameInfo:
+    """Parsed frame structure"""
+
+    codec: str
+    units: list[NalUnit]
+
+    @property
+    def is_keyframe(self) -> bool:
+        """Checks if frame starts a new group of pictures, parameter sets alone may precede non IDR slices"""
+        keyframe_types = H265_NAL_IRAP if self.codec == H265 else (H264_NAL_IDR,)
+        return any(unit.type in keyframe_types for unit in self.units)
+
+    @property
+    def parameter_set_types(self) -> tuple:
+        """NAL unit types carrying parameter sets for codec"""
+        if self.codec == H265:
+            return (H265_NAL_VPS, H265_NAL_SPS, H265_NAL_PPS)
+        return (H264_NAL_SPS, H264_NAL_PPS)
+
+
+def parse_frame(data, codec: str = H264) -> FrameInfo:
+    """Find NAL units of Annex B formatted frame until first slice"""
+    head = bytes(data[0:PROBE_LENGTH])
+    vcl_types = H265_NAL_VCL if codec == H265 else H264_NAL_VCL
+    units = []
+    position = head.find(START_CODE)
+    while position != -1 and position + 3 < len(head):
+        header = head[position + 3]
+        nal_type = (header >> 1) & 0x3F if codec == H265 else header & 0x1F
+        next_position = head.find(START_CODE, position + 3)
+        end = len(data) if next_position == -1 else next_position
+        if next_position != -1 and head[next_position - 1] == 0:
+            # four byte start code of next unit
+            end = end - 1
+        units.append(NalUnit(nal_type, position + 3, end))
+        if nal_type in vcl_types:
+            break
+        position = next_position
+    return FrameInfo(codec, units)
+
+
+def nal_unit_types(data, codec: str = H264):
+    """Yield NAL unit types of Annex B formatted frame until first slice"""
+    for unit in parse_frame(data, codec).units:
+        yield unit.type
+
+
+def is_keyframe(data, codec: str = H264) -> bool:
+    """Checks if frame starts a new group of pictures"""
+    return parse_frame(data, codec).is_keyframe
+
+
+class GopCache:
+    """Latest group of pictures, so new consumers can start from last keyframe"""
+
+    def __init__(self, max_bytes: int = VIDEO_BUFFER_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.keyframe_count = 0
+        self.codec: str = None
+        self.parameter_sets: dict[int, bytes] = {}
+        self._frames: list = []
+        self._keyframe_has_parameter_sets = False
+
+    def add(self, frame, codec: str = H264) -> bool:
+        """Parse and cache frame, return True if frame is a keyframe"""
+        info = parse_frame(frame, codec)
+        if codec != self.codec:
+            self.clear()
+            self.codec = codec
+
+        parameter_set_types = info.parameter_set_types
+        found_parameter_sets = False
+        for unit in info.units:
+            if unit.type in parameter_set_types:
+                self.parameter_sets[unit.type] = LONG_START_CODE + bytes(frame[unit.start : unit.end])
+                found_parameter_sets = True
+
+        keyframe = info.is_keyframe
+        if keyframe is True:
+            self.keyframe_count = self.keyframe_count + 1
+            self._frames = []
+            self.size_bytes = 0
+            self._keyframe_has_parameter_sets = found_parameter_sets
+
+        if self._frames or keyframe is True:
+            if self.size_bytes + len(frame) > self.max_bytes:
+                # group of pictures is too long to cache, wait for next keyframe
+                self._frames = []
+                self.size_bytes = 0
+            else:
+                self._frames.append(frame)
+                self.size_bytes = self.size_bytes + len(frame)
+        return keyframe
+
+    @property
+    def frames(self) -> list:
+        """Frames from last keyframe, prefixed with parameter sets if keyframe does not carry them"""
+        if not self._frames:
+            return []
+        if self._keyframe_has_parameter_sets is True or not self.parameter_sets:
+            return list(self._frames)
+        return [memoryview(b"".join(self.parameter_sets.values()))] + self._frames
+
+    @property
+    def keyframe(self):
+        """Last keyframe, prefixed with parameter sets if it does not carry them"""
+        frames = self.frames
+        if not frames:
+            return None
+        if self._keyframe_has_parameter_sets is True or not self.parameter_sets:
+            return frames[0]
+        return frames[0].tobytes() + bytes(frames[1])
+
+    def clear(self) -> None:
+        """Drop cached frames and parameter sets"""
+        self._frames = []
+        self.size_bytes = 0
+        self.parameter_sets = {}
+        self._keyframe_has_parameter_sets = False
@@ -1,8 +1,8 @@
 from enum import Enum, auto
+import itertools
 import logging
-import uuid
 
-from .const import MessageField, EventSourceType
+from .const import CommandPriority, MessageField, EventSourceType
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -95,39 +95,117 @@ class OutgoingMessageType(Enum):
     is_connected = {MessageField.DUMMY: auto(), MessageField.DOMAIN: EventSourceType.station}
 
 
+# add-on answers most commands from its own state, these wait for cloud or device round trips
+DEFAULT_COMMAND_TIMEOUT_SECONDS = 15
+COMMAND_TIMEOUT_SECONDS = {
+    OutgoingMessageType.start_listening: 60,
+    OutgoingMessageType.connect: 60,
+    OutgoingMessageType.poll_refresh: 60,
+    OutgoingMessageType.set_captcha: 60,
+    OutgoingMessageType.set_verify_code: 60,
+    OutgoingMessageType.get_video_events: 60,
+    OutgoingMessageType.set_property: 30,
+    OutgoingMessageType.trigger_alarm: 30,
+    OutgoingMessageType.reset_alarm: 30,
+    OutgoingMessageType.pan_and_tilt: 30,
+    OutgoingMessageType.preset_position: 30,
+    OutgoingMessageType.save_preset_position: 30,
+    OutgoingMessageType.delete_preset_position: 30,
+    OutgoingMessageType.calibrate: 30,
+    OutgoingMessageType.start_rtsp_livestream: 30,
+    OutgoingMessageType.stop_rtsp_livestream: 30,
+    OutgoingMessageType.start_livestream: 30,
+    OutgoingMessageType.stop_livestream: 30,
+    OutgoingMessageType.quick_response: 30,
+    OutgoingMessageType.snooze: 30,
+    OutgoingMessageType.verify_pin: 30,
+    OutgoingMessageType.unlock: 30,
+    OutgoingMessageType.chime: 30,
+    OutgoingMessageType.reboot: 30,
+}
+
+# user initiated control goes first, streaming next, discovery queries and polls last
+COMMAND_PRIORITIES = {
+    OutgoingMessageType.set_property: CommandPriority.interactive,
+    OutgoingMessageType.trigger_alarm: CommandPriority.interactive,
+    OutgoingMessageType.reset_alarm: CommandPriority.interactive,
+    OutgoingMessageType.pan_and_tilt: CommandPriority.interactive,
+    OutgoingMessageType.preset_position: CommandPriority.interactive,
+    OutgoingMessageType.save_preset_position: CommandPriority.interactive,
+    OutgoingMessageType.delete_preset_position: CommandPriority.interactive,
+    OutgoingMessageType.calibrate: CommandPriority.interactive,
+    OutgoingMessageType.quick_response: CommandPriority.interactive,
+    OutgoingMessageType.snooze: CommandPriority.interactive,
+    OutgoingMessageType.verify_pin: CommandPriority.interactive,
+    OutgoingMessageType.unlock: CommandPriority.interactive,
+    OutgoingMessageType.chime: CommandPriority.interactive,
+    OutgoingMessageType.reboot: CommandPriority.interactive,
+    OutgoingMessageType.set_captcha: CommandPriority.interactive,
+    OutgoingMessageType.set_verify_code: CommandPriority.interactive,
+    OutgoingMessageType.start_rtsp_livestream: CommandPriority.streaming,
+    OutgoingMessageType.stop_rtsp_livestream: CommandPriority.streaming,
+    OutgoingMessageType.start_livestream: CommandPriority.streaming,
+    OutgoingMessageType.stop_livestream: CommandPriority.streaming,
+}
+
+
+class _MessageTemplate:
+    """Fields, command and scheduling of a message type, resolved once at import"""
+
+    __slots__ = ("fields", "command", "priority", "timeout")
+
+    def __init__(self, message_type: OutgoingMessageType) -> None:
+        fields = []
+        for key in message_type.value.keys():
+            if key.value in OutgoingMessageToParameter.__members__:
+                fields.append((key.value, OutgoingMessageToParameter[key.value].value))
+
+        default_domain = message_type.value[MessageField.DOMAIN]
+        if default_domain in [EventSourceType.product, EventSourceType.station, EventSourceType.device]:
+            fields.append((MessageField.SERIAL_NO.value, OutgoingMessageToParameter[MessageField.SERIAL_NO.value].value))
+        self.fields: tuple[tuple[str, str], ...] = tuple(fields)
+
+        # product level commands get their domain at runtime
+        self.command: str = None
+        if default_domain == EventSourceType.server:
+            self.command = message_type.name
+        elif default_domain != EventSourceType.product:
+            self.command = default_domain.value + "." + message_type.name
+
+        self.priority: CommandPriority = COMMAND_PRIORITIES.get(message_type, CommandPriority.bulk)
+        self.timeout: float = COMMAND_TIMEOUT_SECONDS.get(message_type, DEFAULT_COMMAND_TIMEOUT_SECONDS)
+
+
+_TEMPLATES = {message_type: _MessageTemplate(message_type) for message_type in OutgoingMessageType}
+# ids only have to be unique among commands waiting for response
+_MESSAGE_IDS = itertools.count(1)
+
+
 class OutgoingMessage:
     """Outgoing message"""
 
+    __slots__ = ("_type", "_template", "_message")
+
     def __init__(self, message_type: OutgoingMessageType, **kwargs) -> None:
         self._type = message_type
-        self._message = {}
-
-        for key in message_type.value.keys():
-            try:
-                self._message[key.value] = kwargs.get(OutgoingMessageToParameter[key.value].value)
-            except KeyError:
-                pass
-
-        default_domain = message_type.value[MessageField.DOMAIN]
-        if default_domain in [EventSourceType.product, EventSourceType.station, EventSourceType.device]:
-            self._message[MessageField.SERIAL_NO.value] = kwargs.get(OutgoingMessageToParameter[MessageField.SERIAL_NO.value].value)
+        self._template = template = _TEMPLATES[message_type]
+        self._message = {field: kwargs.get(parameter) for field, parameter in template.fields}
 
-        domain = default_domain.value if default_domain != EventSourceType.product else kwargs.get(MessageField.DOMAIN.value, "")
-        command = self.type.name if domain == EventSourceType.server.value else domain + "." + self.type.name
-        _LOGGER.debug(f"domain - {domain} - {default_domain} - {command} - {kwargs} - {self._message}")
+        command = template.command
+        if command is None:
+            command = kwargs.get(MessageField.DOMAIN.value, "") + "." + message_type.name
         self._message[MessageField.COMMAND.value] = command
-        self._message[MessageField.MESSAGE_ID.value] = self.command + "." + uuid.uuid4().hex
-        _LOGGER.debug(self._message)
+        self._message[MessageField.MESSAGE_ID.value] = f"{command}.{next(_MESSAGE_IDS)}"
 
     @property
     def id(self) -> str:
         """Message Id"""
-        return self.content[MessageField.MESSAGE_ID.value]
+        return self._message[MessageField.MESSAGE_ID.value]
 
     @property
     def command(self) -> str:
         """Message Command"""
-        return self.content[MessageField.COMMAND.value]
+        return self._message[MessageField.COMMAND.value]
 
     @property
     def content(self) -> str:
@@ -138,3 +216,13 @@ class OutgoingMessage:
     def type(self) -> OutgoingMessageType:
         """Message Type"""
         return self._type
+
+    @property
+    def priority(self) -> CommandPriority:
+        """Scheduling priority"""
+        return self._template.priority
+
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for response"""
+        return self._template.timeout
@@ -3,13 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import socket
-import threading
-import json
-from time import sleep
 import traceback
 import aiohttp
-import os
 from .const import GO2RTC_API_PORT, GO2RTC_API_URL, STREAM_TIMEOUT_SECONDS
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -21,18 +16,19 @@ class P2PStreamer:
         self.camera = camera
         self.retry = None
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared http session of api client, pooling connections to go2rtc across cameras"""
+        return self.camera.api.session
+
     async def chunk_generator(self, queue, queue_name):
-        retry_count = 0
-        max_retry_count = int(STREAM_TIMEOUT_SECONDS / 0.1)
-        while retry_count < max_retry_count:
+        while True:
             try:
-                item = queue.popleft()
-                #_LOGGER.debug(f"chunk_generator {queue_name} yield data {retry_count} - {len(item)}")
-                retry_count = 0
-                yield item
-            except IndexError:
-                retry_count = retry_count + 1
-                await asyncio.sleep(0.1)
+                item = await queue.get(STREAM_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                _LOGGER.debug(f"chunk_generator {queue_name} - no data for {STREAM_TIMEOUT_SECONDS} seconds")
+                return
+            yield item
 
     async def write_bytes(self, queue, queue_name):
         url = GO2RTC_API_URL.format(self.camera.config.rtsp_server_address, GO2RTC_API_PORT)
@@ -40,8 +36,7 @@ class P2PStreamer:
 
         self.retry = None
         try:
-            async with aiohttp.ClientSession() as session:
-                resp = await session.post(url, data = self.chunk_generator(queue, queue_name), timeout=aiohttp.ClientTimeout(total=None, connect=5))
+            async with self.session.post(url, data = self.chunk_generator(queue, queue_name), timeout=aiohttp.ClientTimeout(total=None, connect=5)) as resp:
                 _LOGGER.debug(f"write_bytes {queue_name} - post response - {resp.status} - {await resp.text()}")
                 if resp is not None and resp.status is not None:
                     if resp.status == 500:
@@ -49,10 +44,15 @@ class P2PStreamer:
                 self.retry = self.retry or False
 
             _LOGGER.debug("write_bytes - post ended - {self.retry}")
-        except (asyncio.exceptions.TimeoutError, asyncio.exceptions.CancelledError) as ex:
+        except asyncio.exceptions.TimeoutError as ex:
             # live stream probabaly stopped, handle peacefully
-            _LOGGER.debug(f"write_bytes {queue_name} timeout/cancelled NO RETRY exception {ex} - traceback: {traceback.format_exc()}")
+            _LOGGER.debug(f"write_bytes {queue_name} timeout NO RETRY exception {ex} - traceback: {traceback.format_exc()}")
+            self.retry = self.retry or False
+        except asyncio.exceptions.CancelledError:
+            # streamer task is cancelled, let stream checker finish and stop the task
+            _LOGGER.debug(f"write_bytes {queue_name} cancelled NO RETRY")
             self.retry = self.retry or False
+            raise
         except aiohttp.client_exceptions.ServerDisconnectedError as ex:
             # connection to go2rtc server is broken, try again``
             _LOGGER.debug(f"write_bytes {queue_name} server_disconnected RETRY exception {ex} - traceback: {traceback.format_exc()}")
@@ -65,31 +65,28 @@ class P2PStreamer:
         _LOGGER.debug(f"write_bytes {queue_name} - ended with {self.retry}")
 
     async def _create_stream_on_go2rtc(self):
-        parameters = {"name": str(self.camera.serial_no)}
         url = GO2RTC_API_URL.format(self.camera.config.rtsp_server_address, GO2RTC_API_PORT)
         url = f"{url}s"
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, params=parameters) as response:
-                result = response.status, await response.text()
-                _LOGGER.debug(f"create_stream_on_go2rtc - delete stream response {result}")
 
-        parameters = {"name": str(self.camera.serial_no), "src": "tcp://127.0.0.1:65535"}
-        url = GO2RTC_API_URL.format(self.camera.config.rtsp_server_address, GO2RTC_API_PORT)
-        url = f"{url}s"
-        async with aiohttp.ClientSession() as session:
-            async with session.put(url, params=parameters) as response:
-                result = response.status, await response.text()
-                _LOGGER.debug(f"create_stream_on_go2rtc - put stream response {result}")
+        parameters = {"name": str(self.camera.serial_no)}
+        async with self.session.delete(url, params=parameters) as response:
+            result = response.status, await response.text()
+            _LOGGER.debug(f"create_stream_on_go2rtc - delete stream response {result}")
 
-    def _run(self, queue, name):
-        asyncio.run(self.write_bytes(queue, name))
+        parameters = {"name": str(self.camera.serial_no), "src": "tcp://127.0.0.1:65535"}
+        async with self.session.put(url, params=parameters) as response:
+            result = response.status, await response.text()
+            _LOGGER.debug(f"create_stream_on_go2rtc - put stream response {result}")
 
     async def start(self):
-        """start streaming thread"""
+        """start streaming on current event loop"""
         # send API command to go2rtc to create a new stream
         self.retry = None
         await self._create_stream_on_go2rtc()
-        await asyncio.gather(
-            #asyncio.to_thread(self._run, self.camera.audio_queue, "audio"),
-            asyncio.to_thread(self._run, self.camera.video_queue, "video")
-        )
+        # push from last keyframe, so go2rtc can decode without waiting for the next one
+        queue = self.camera.add_video_consumer()
+        self.camera.video_queue = queue
+        try:
+            await self.write_bytes(queue, "video")
+        finally:
+            self.camera.remove_video_consumer(queue)
@@ -1,9 +1,10 @@
 import asyncio
 from collections.abc import Callable
 import logging
+import sys
 from typing import Any
 
-from .const import EventNameToHandler, MessageField, ProductCommand, ProductType, UNSUPPORTED
+from .const import LIVESTREAM_DATA_EVENTS, EventNameToHandler, MessageField, ProductCommand, ProductType, UNSUPPORTED
 from .event import Event
 from .metadata import Metadata
 
@@ -29,16 +30,32 @@ class Product:
         self.commands = commands
         self.connected = True
 
-        self.state_update_listener: Callable = None
-
         self._set_properties(properties)
         self._set_metadata(metadata)
 
         self.pin_verified_future = None
+        self._event_handlers = {
+            event_type: (handler, None if method_name is None else getattr(self, method_name))
+            for event_type, (handler, method_name) in self._get_event_handler_names().items()
+        }
+
+    @classmethod
+    def _get_event_handler_names(cls) -> dict[str, tuple[EventNameToHandler, str | None]]:
+        # resolved once per class, instances bind them at creation
+        names = cls.__dict__.get("_event_handler_names", None)
+        if names is None:
+            names = {}
+            for handler in EventNameToHandler:
+                method_name = f"_handle_{handler.name}"
+                names[handler.value] = (handler, method_name if hasattr(cls, method_name) else None)
+            cls._event_handler_names = names
+        return names
 
     def _set_properties(self, properties: dict) -> None:
-        self.properties = properties
-        _LOGGER.debug(f"_set_properties -{self.serial_no} - {str(properties)[0:5000]}")
+        # property names repeat across products, share one string per name
+        self.properties = {sys.intern(name): value for name, value in properties.items()}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"_set_properties -{self.serial_no} - {str(properties)[0:5000]}")
         self.name = properties.get(MessageField.NAME.value, "UNSUPPORTED")
         self.model = properties.get(MessageField.MODEL.value, "UNSUPPORTED")
         self.hardware_version = properties.get(MessageField.HARDWARE_VERSION.value, "UNSUPPORTED")
@@ -48,16 +65,29 @@ class Product:
         self.metadata = {}
 
         for key, value in metadata.items():
-            metadata = Metadata.parse(self, value)
+            if key == "motionDetected" and value.get(MessageField.NAME.value, None) == "motionDetection":
+                value = {**value, MessageField.NAME.value: key}
+
+            self.metadata[sys.intern(key)] = Metadata.parse(self, value)
 
-            if key == "motionDetected" and metadata.name == "motionDetection":
-                metadata.name = key
+    def reconcile(self, properties: dict, metadata: dict, commands: list) -> bool:
+        """Update restored product with discovered state, return False if its properties metadata changed"""
+        restored = self.metadata
+        self.commands = commands
+        self.metadata_org = metadata
+        self._set_properties(properties)
+        self._set_metadata(metadata)
 
-            self.metadata[key] = metadata
+        # entities keep references to restored metadata instances, update them in place
+        for key, value in self.metadata.items():
+            if key in restored:
+                restored[key].definition = value.definition
+                self.metadata[key] = restored[key]
+        return restored.keys() == self.metadata.keys()
 
-    def set_state_update_listener(self, listener: Callable):
-        """Set listener function when state changes"""
-        self.state_update_listener = listener
+    def add_state_update_listener(self, listener: Callable, property_names: list[str] = None) -> Callable:
+        """Add listener function for changes of given properties and product level events, return function to remove it"""
+        return self.api.state_update_registry.subscribe(self.serial_no, property_names, listener)
 
     async def set_property(self, metadata, value: Any):
         """Process set property call"""
@@ -89,25 +119,34 @@ class Product:
 
     async def process_event(self, event: Event):
         """Act on received event"""
-        handler_func = None
-
         try:
-            handler = EventNameToHandler(event.type)
-            handler_func = getattr(self, f"_handle_{handler.name}", None)
-        except ValueError:
+            handler, handler_func = self._event_handlers[event.type]
+        except KeyError:
             # event is not acted on, skip it
-            _LOGGER.debug(f"event not handled -{self.serial_no} - {event}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"event not handled -{self.serial_no} - {event}")
             return
 
+        changed = None
         if handler_func is not None:
-            await handler_func(event)
+            changed = await handler_func(event)
 
-        if self.state_update_listener is not None:
-            callback_func = self.state_update_listener
-            callback_func()
+        # data plane events never change entity state, handlers return False when nothing changed
+        if changed is False or event.type in LIVESTREAM_DATA_EVENTS:
+            return
+
+        if handler == EventNameToHandler.property_changed:
+            self.api.state_update_registry.notify_property(self.serial_no, event.data[MessageField.NAME.value])
+        else:
+            self.api.state_update_registry.notify_product(self.serial_no)
 
     async def _handle_property_changed(self, event: Event):
-        self.properties[event.data[MessageField.NAME.value]] = event.data[MessageField.VALUE.value]
+        name = event.data[MessageField.NAME.value]
+        value = event.data[MessageField.VALUE.value]
+        if name in self.properties and self.properties[name] == value:
+            return False
+        self.properties[name] = value
+        return True
 
     async def _handle_pin_verified(self, event: Event):
         self.pin_verified_future.set_result(event)
@@ -149,6 +188,26 @@ class Station(Product):
     def __init__(self, api, serial_no: str, properties: dict, metadata: dict, commands: []) -> None:
         super().__init__(api, ProductType.station, serial_no, properties, metadata, commands)
 
+    @property
+    def commands_in_flight(self) -> int:
+        """Number of commands waiting for add-on response"""
+        return self.api.commands_in_flight
+
+    @property
+    def command_timeouts(self) -> int:
+        """Number of commands add-on did not answer in time"""
+        return self.api.command_timeouts
+
+    @property
+    def event_backlog_peak(self) -> int:
+        """Highest number of events waiting for a single product"""
+        return self.api.event_dispatcher.peak
+
+    @property
+    def dropped_events(self) -> int:
+        """Number of events dropped because a product fell behind"""
+        return self.api.event_dispatcher.dropped
+
     async def chime(self, ringtone: int) -> None:
         """Quick response message to camera"""
         await self.api.chime(self.product_type, self.serial_no, ringtone)
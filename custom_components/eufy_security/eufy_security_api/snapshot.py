@@ -0,0 +1,99 @@
+"""Module to generate camera snapshots from cached keyframes"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+import logging
+
+from .nal import H265
+
+try:
+    import av
+except ImportError:  # pragma: no cover
+    av = None
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+JPEG_PIXEL_FORMAT = "yuvj420p"
+
+
+class SnapshotEngine:
+    """Decode latest keyframe of camera into JPEG with one long lived decoder worker"""
+
+    def __init__(self, camera) -> None:
+        self.camera = camera
+        self._executor: ThreadPoolExecutor = None
+        self._decoder = None
+        self._decoder_codec: str = None
+        self._keyframe_count: int = None
+        self._images: dict[tuple, bytes] = {}
+
+    @property
+    def available(self) -> bool:
+        """Checks if in process decoding is supported"""
+        return av is not None
+
+    async def async_get_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
+        """Return JPEG of latest keyframe, cached per size until a newer keyframe arrives"""
+        gop_cache = self.camera.gop_cache
+        if self.available is False or gop_cache.keyframe is None:
+            return None
+
+        keyframe_count = gop_cache.keyframe_count
+        if keyframe_count != self._keyframe_count:
+            self._images = {}
+            self._keyframe_count = keyframe_count
+
+        size = (width, height)
+        image = self._images.get(size, None)
+        if image is not None:
+            return image
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"eufy_security_snapshot_{self.camera.serial_no}")
+        image = await asyncio.get_running_loop().run_in_executor(self._executor, self._decode, bytes(gop_cache.keyframe), gop_cache.codec, width, height)
+        if image is not None and keyframe_count == self._keyframe_count:
+            self._images[size] = image
+        return image
+
+    def close(self) -> None:
+        """Stop decoder worker"""
+        self._images = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _decode(self, keyframe: bytes, codec: str, width: int | None, height: int | None) -> bytes | None:
+        try:
+            if self._decoder is None or self._decoder_codec != codec:
+                self._decoder = av.CodecContext.create("hevc" if codec == H265 else "h264", "r")
+                self._decoder_codec = codec
+
+            frames = []
+            for packet in self._decoder.parse(keyframe) + self._decoder.parse(None):
+                frames.extend(self._decoder.decode(packet))
+            # keyframe is decoded on its own, drain and reset decoder for next call
+            frames.extend(self._decoder.decode(None))
+            self._decoder.flush_buffers()
+            if not frames:
+                _LOGGER.debug(f"snapshot {self.camera.serial_no} - keyframe produced no picture")
+                return None
+            return self._encode(frames[-1], width, height)
+        except (av.error.FFmpegError, AttributeError, ValueError) as ex:
+            # decoder is in unknown state, recreate on next call
+            _LOGGER.debug(f"snapshot {self.camera.serial_no} - decode failed {ex}")
+            self._decoder = None
+            return None
+
+    def _encode(self, frame, width: int | None, height: int | None) -> bytes:
+        if width is None or height is None:
+            width, height = frame.width, frame.height
+        frame = frame.reformat(width=width, height=height, format=JPEG_PIXEL_FORMAT)
+        encoder = av.CodecContext.create("mjpeg", "w")
+        encoder.width = width
+        encoder.height = height
+        encoder.pix_fmt = JPEG_PIXEL_FORMAT
+        encoder.time_base = Fraction(1, 1)
+        packets = encoder.encode(frame) + encoder.encode(None)
+        return b"".join(bytes(packet) for packet in packets)
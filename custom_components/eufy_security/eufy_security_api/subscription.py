@@ -0,0 +1,93 @@
+"""Module to route state updates to subscribed listeners"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import time
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# subscribe to every property of a product
+ALL_PROPERTIES = "*"
+
+
+def parse_throttle_windows(value: str) -> dict[str, float]:
+    """Parse comma separated property:seconds pairs"""
+    windows = {}
+    for item in (value or "").split(","):
+        if item.strip() == "":
+            continue
+        try:
+            name, seconds = item.split(":")
+            windows[name.strip()] = float(seconds)
+        except ValueError:
+            _LOGGER.warning(f"invalid property throttle entry is skipped - {item}")
+    return windows
+
+
+class StateUpdateRegistry:
+    """State update subscriptions keyed by serial number and property name"""
+
+    def __init__(self, throttle_windows: dict[str, float] = None) -> None:
+        # dict values are unused, dict keeps listeners unique and in subscription order
+        self._listeners: dict[tuple[str, str | None], dict[Callable, None]] = {}
+        self.throttle_windows: dict[str, float] = throttle_windows or {}
+        self._last_notified: dict[tuple[str, str], float] = {}
+        self._pending: dict[tuple[str, str], asyncio.TimerHandle] = {}
+
+    def subscribe(self, serial_no: str, property_names: list[str] | None, listener: Callable) -> Callable:
+        """Subscribe listener to property changes and product level events, return function to unsubscribe"""
+        keys = [(serial_no, None)] + [(serial_no, name) for name in property_names or []]
+        for key in keys:
+            self._listeners.setdefault(key, {})[listener] = None
+
+        def unsubscribe() -> None:
+            for key in keys:
+                listeners = self._listeners.get(key, {})
+                listeners.pop(listener, None)
+                if not listeners:
+                    self._listeners.pop(key, None)
+
+        return unsubscribe
+
+    def notify_property(self, serial_no: str, property_name: str) -> None:
+        """Call listeners subscribed to changed property, at most once per throttle window of property"""
+        window = self.throttle_windows.get(property_name, 0)
+        if window > 0:
+            key = (serial_no, property_name)
+            if key in self._pending:
+                # trailing update is already scheduled and will pick up latest value
+                return
+            elapsed = time.monotonic() - self._last_notified.get(key, 0)
+            if elapsed < window:
+                self._pending[key] = asyncio.get_running_loop().call_later(window - elapsed, self._notify_pending, key)
+                return
+            self._last_notified[key] = time.monotonic()
+        self._notify_property_listeners(serial_no, property_name)
+
+    def close(self) -> None:
+        """Cancel scheduled trailing updates"""
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending = {}
+
+    def _notify_pending(self, key: tuple[str, str]) -> None:
+        self._pending.pop(key, None)
+        self._last_notified[key] = time.monotonic()
+        self._notify_property_listeners(*key)
+
+    def _notify_property_listeners(self, serial_no: str, property_name: str) -> None:
+        listeners = dict(self._listeners.get((serial_no, property_name), {}))
+        listeners.update(self._listeners.get((serial_no, ALL_PROPERTIES), {}))
+        for listener in listeners:
+            listener()
+
+    def notify_product(self, serial_no: str) -> None:
+        """Call all listeners of product"""
+        for listener in list(self._listeners.get((serial_no, None), {})):
+            listener()
+
+    def listener_count(self, serial_no: str) -> int:
+        """Number of listeners subscribed to product"""
+        return len(self._listeners.get((serial_no, None), {}))
@@ -0,0 +1,76 @@
+"""Module to buffer livestream video frames with bounded memory"""
+from __future__ import annotations
+
+from collections import deque
+import logging
+
+from .const import VIDEO_BUFFER_MAX_BYTES
+from .frame_queue import FrameQueue
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class VideoFrameBuffer(FrameQueue):
+    """Byte bounded video frame queue, dropping whole groups of pictures when it overflows"""
+
+    def __init__(self, max_bytes: int = VIDEO_BUFFER_MAX_BYTES) -> None:
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.dropped_frames = 0
+        self.dropped_bytes = 0
+        self._keyframes: deque = deque()
+        self._wait_for_keyframe = False
+
+    @property
+    def fill_level(self) -> float:
+        """Buffer usage in percent"""
+        return round(self.size_bytes * 100 / self.max_bytes, 1)
+
+    def put(self, frame, keyframe: bool = False) -> None:
+        """Append frame, dropping oldest groups of pictures to stay in byte budget"""
+        if self._wait_for_keyframe is True:
+            if keyframe is False:
+                self._drop(frame)
+                return
+            self._wait_for_keyframe = False
+
+        self.size_bytes = self.size_bytes + len(frame)
+        self._keyframes.append(keyframe)
+        super().put(frame)
+
+        while self.size_bytes > self.max_bytes:
+            self._drop_oldest_gop()
+
+    def clear(self) -> None:
+        """Drop all queued frames"""
+        super().clear()
+        self._keyframes.clear()
+        self.size_bytes = 0
+        self._wait_for_keyframe = False
+
+    async def get(self, timeout: float = None):
+        """Return next frame, wait until one arrives or raise asyncio.TimeoutError after timeout"""
+        frame = await super().get(timeout)
+        self._keyframes.popleft()
+        self.size_bytes = self.size_bytes - len(frame)
+        return frame
+
+    def _drop(self, frame) -> None:
+        self.dropped_frames = self.dropped_frames + 1
+        self.dropped_bytes = self.dropped_bytes + len(frame)
+
+    def _pop_frame(self) -> None:
+        frame = self._frames.popleft()
+        self._keyframes.popleft()
+        self.size_bytes = self.size_bytes - len(frame)
+        self._drop(frame)
+
+    def _drop_oldest_gop(self) -> None:
+        self._pop_frame()
+        while self._frames and self._keyframes[0] is False:
+            self._pop_frame()
+        if not self._frames:
+            # whole buffer was one group of pictures, resume with the next decodable frame
+            self._wait_for_keyframe = True
+        _LOGGER.debug(f"video buffer overflow - dropped {self.dropped_frames} frames / {self.dropped_bytes} bytes so far")
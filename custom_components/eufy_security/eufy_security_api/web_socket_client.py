@@ -1,11 +1,14 @@
 import asyncio
 from collections.abc import Callable, Coroutine
 import logging
+import time
 from typing import Any, Text
 import traceback
 
 import aiohttp
 
+from .codec import MessageCodec
+from .compression import CompressionProbe
 from .exceptions import WebSocketConnectionException
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -23,6 +26,9 @@ class WebSocketClient:
         message_callback: Callable[[], Coroutine[Any, Any, None]],
         close_callback: Callable[[], Coroutine[Any, Any, None]],
         error_callback: Callable[[Text], Coroutine[Any, Any, None]],
+        codec: MessageCodec = None,
+        compress: int = 9,
+        probe: CompressionProbe = None,
     ) -> None:
         self.host = host
         self.port = port
@@ -31,6 +37,9 @@ class WebSocketClient:
         self.message_callback = message_callback
         self.close_callback = close_callback
         self.error_callback = error_callback
+        self.codec: MessageCodec = codec or MessageCodec()
+        self.compress = compress
+        self.probe = probe
 
         self.socket: aiohttp.ClientWebSocketResponse = None
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -39,7 +48,7 @@ class WebSocketClient:
     async def connect(self):
         """Set up web socket connection"""
         try:
-            self.socket = await self.session.ws_connect(f"ws://{self.host}:{self.port}", heartbeat=10, compress=9)
+            self.socket = await self.session.ws_connect(f"ws://{self.host}:{self.port}", heartbeat=10, compress=self.compress)
         except Exception as exc:
             raise WebSocketConnectionException("Connection to add-on was broken. please reload the integration!") from exc
         self.task = self.loop.create_task(self._process_messages())
@@ -64,11 +73,19 @@ class WebSocketClient:
             await self._on_message(msg)
 
     async def _on_message(self, message):
+        start = time.thread_time()
         try:
             if self.message_callback is not None:
-                await self.message_callback(message.json())
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    await self.message_callback(self.codec.decode(message.data))
+                elif message.type == aiohttp.WSMsgType.BINARY:
+                    await self.message_callback(self.codec.decode_binary(message.data))
+                else:
+                    _LOGGER.debug(f"websocket client _on_message - skipped {message.type}")
         except:
             traceback.print_exc()
+        if self.probe is not None and message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+            self.probe.record(message.data, time.thread_time() - start)
 
     async def _on_error(self, error: Text = "Unspecified") -> None:
         if self.error_callback is not None:
@@ -86,6 +103,10 @@ class WebSocketClient:
             raise WebSocketConnectionException("Connection to add-on was broken. please reload the integration!")
         await self.socket.send_str(message)
 
+    async def send_json(self, message: dict):
+        """Encode message with codec and send to websocket"""
+        await self.send_message(self.codec.encode(message))
+
     @property
     def available(self) -> bool:
         return self.socket is not None
\ No newline at end of file
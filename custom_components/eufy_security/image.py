@@ -16,6 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import COORDINATOR, DOMAIN, Schema
 from .coordinator import EufySecurityDataUpdateCoordinator
 from .entity import EufySecurityEntity
+from .eufy_security_api.const import MessageField
 from .eufy_security_api.metadata import Metadata
 
 
@@ -45,6 +46,11 @@ class EufySecurityImage(ImageEntity, EufySecurityEntity):
         # camera image
         self._last_image = None
 
+    @property
+    def subscribed_properties(self) -> list[str]:
+        """Product properties backing entity state"""
+        return [MessageField.PICTURE.value]
+
     @property
     def image_last_updated(self) -> datetime | None:
         """The time when the image was last updated."""
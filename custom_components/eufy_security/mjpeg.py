@@ -0,0 +1,114 @@
+"""Module to share one MJPEG transcoder between all viewers of a camera"""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from aiohttp import web
+from haffmpeg.camera import CameraMjpeg
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# ffmpeg mpjpeg muxer separates frames with this boundary, see ffmpeg_stream_content_type
+MJPEG_BOUNDARY = b"--ffmpeg"
+MJPEG_READ_SIZE = 65536
+MJPEG_VIEWER_QUEUE_SIZE = 2
+
+
+class MjpegBroadcaster:
+    """Reference counted MJPEG transcoder, multicasting whole frames to attached viewers"""
+
+    def __init__(self, ffmpeg_binary: str) -> None:
+        self.ffmpeg_binary = ffmpeg_binary
+        self._viewers: set[asyncio.Queue] = set()
+        self._stream: CameraMjpeg = None
+        self._task: asyncio.Task = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def viewer_count(self) -> int:
+        """Number of attached viewers"""
+        return len(self._viewers)
+
+    async def async_handle(self, request: web.Request, stream_source: str, content_type: str) -> web.StreamResponse:
+        """Attach request as viewer and stream frames until client or transcoder leaves"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MJPEG_VIEWER_QUEUE_SIZE)
+        await self._attach(queue, stream_source)
+
+        response = web.StreamResponse()
+        response.content_type = content_type
+        try:
+            await response.prepare(request)
+            while True:
+                frame = await queue.get()
+                if frame is None:
+                    break
+                await response.write(frame)
+        except ConnectionResetError:
+            _LOGGER.debug("mjpeg viewer left")
+        finally:
+            await self._detach(queue)
+        return response
+
+    async def _attach(self, queue: asyncio.Queue, stream_source: str) -> None:
+        async with self._lock:
+            if self._task is None:
+                self._stream = CameraMjpeg(self.ffmpeg_binary)
+                try:
+                    await self._stream.open_camera(stream_source)
+                except BaseException:
+                    # transcoder did not start, leave broadcaster clean for next viewer
+                    await self._close()
+                    raise
+                self._task = asyncio.create_task(self._read_frames(self._stream))
+            self._viewers.add(queue)
+            _LOGGER.debug(f"mjpeg viewer attached - {self.viewer_count}")
+
+    async def _detach(self, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            self._viewers.discard(queue)
+            _LOGGER.debug(f"mjpeg viewer detached - {self.viewer_count}")
+            if not self._viewers:
+                await self._close()
+
+    async def _close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._stream is not None:
+            await self._stream.close()
+            self._stream = None
+
+    async def _read_frames(self, stream: CameraMjpeg) -> None:
+        reader = await stream.get_reader()
+        buffer = b""
+        try:
+            while True:
+                chunk = await reader.read(MJPEG_READ_SIZE)
+                if not chunk:
+                    break
+                buffer = buffer + chunk
+                position = buffer.find(MJPEG_BOUNDARY, 1)
+                while position != -1:
+                    self._broadcast(buffer[0:position])
+                    buffer = buffer[position:]
+                    position = buffer.find(MJPEG_BOUNDARY, 1)
+            _LOGGER.debug("mjpeg transcoder ended")
+            await stream.close()
+        finally:
+            # transcoder ended, release viewers
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._stream = None
+            for queue in self._viewers:
+                self._offer(queue, None)
+
+    def _broadcast(self, frame: bytes) -> None:
+        for queue in self._viewers:
+            self._offer(queue, frame)
+
+    def _offer(self, queue: asyncio.Queue, frame: bytes | None) -> None:
+        if queue.full():
+            # slow viewer, drop its oldest frame
+            queue.get_nowait()
+        queue.put_nowait(frame)
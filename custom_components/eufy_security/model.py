@@ -3,6 +3,8 @@ from enum import auto, Enum, StrEnum
 
 from homeassistant.config_entries import ConfigEntry
 
+from .eufy_security_api.const import CONTROL_CONNECTION_COMPRESSION, DISCOVERY_CONCURRENCY, STREAM_CONNECTION_COMPRESSION
+
 
 @dataclass
 class EntityDescription:
@@ -27,6 +29,14 @@ class ConfigField(Enum):
     name_for_custom1 = "Custom 1"
     name_for_custom2 = "Custom 2"
     name_for_custom3 = "Custom 3"
+    # values of members below are placeholders, equal values would turn them into aliases of each other
+    property_throttle = 13
+    discovery_concurrency = 14
+    warm_start = 15
+    separate_stream_connection = 16
+    control_compression = 17
+    stream_compression = 18
+    compression_measurement = 19
     captcha_id = 8
     captcha_img = 9
     captcha_input = 10
@@ -47,6 +57,13 @@ class Config:
     name_for_custom1: str = ConfigField.name_for_custom1.value
     name_for_custom2: str = ConfigField.name_for_custom2.value
     name_for_custom3: str = ConfigField.name_for_custom3.value
+    property_throttle: str = ""
+    discovery_concurrency: int = DISCOVERY_CONCURRENCY
+    warm_start: bool = True
+    separate_stream_connection: bool = False
+    control_compression: int = CONTROL_CONNECTION_COMPRESSION
+    stream_compression: int = STREAM_CONNECTION_COMPRESSION
+    compression_measurement: bool = False
     captcha_id: str = None
     captcha_img: str = None
     captcha_input: str = None
@@ -9,6 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import COORDINATOR, DOMAIN, Platform, PlatformToPropertyType
 from .coordinator import EufySecurityDataUpdateCoordinator
 from .entity import EufySecurityEntity
+from .eufy_security_api.const import StatisticName
 from .eufy_security_api.metadata import Metadata
 from .eufy_security_api.util import get_child_value
 from .util import get_product_properties_by_filter
@@ -32,7 +33,9 @@ class CameraSensor(Enum):
     stream_provider = "Stream Provider"
     stream_url = "Stream URL"
     stream_status = "Stream Status"
-    video_queue_size = "Video Queue Size"
+    video_buffer_level = "Video Buffer Level"
+    video_dropped_frames = "Video Dropped Frames"
+    video_dropped_bytes = "Video Dropped Bytes"
     audio_queue_size = "Audio Queue Size"
 
 
@@ -47,6 +50,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         if camera.is_camera is True:
             for metadata in CameraSensor:
                 product_properties.append(Metadata.parse(camera, {"name": metadata.name, "label": metadata.value}))
+    # client statistics are not station specific, present them once
+    station = coordinator.stations.get(coordinator.statistics_serial_no, None)
+    if station is not None:
+        for metadata in StatisticName:
+            product_properties.append(Metadata.parse(station, {"name": metadata.name, "label": metadata.value}))
     entities = [EufySecuritySensor(coordinator, metadata) for metadata in product_properties]
     async_add_entities(entities)
 
@@ -63,14 +71,21 @@ class EufySecuritySensor(SensorEntity, EufySecurityEntity):
     def native_value(self):
         """Return the value reported by the sensor."""
         if self.metadata.name in CameraSensor.__members__:
-            if self.metadata.name == CameraSensor.video_queue_size.name:
-                return len(self.product.video_queue)
+            if self.metadata.name == CameraSensor.video_buffer_level.name:
+                return self.product.video_queue.fill_level
+            if self.metadata.name == CameraSensor.video_dropped_frames.name:
+                return self.product.video_queue.dropped_frames
+            if self.metadata.name == CameraSensor.video_dropped_bytes.name:
+                return self.product.video_queue.dropped_bytes
             if self.metadata.name == CameraSensor.audio_queue_size.name:
                 return len(self.product.audio_queue)
             if self.metadata.name == CameraSensor.stream_provider.name:
                 return self.product.stream_provider.name
             return get_child_value(self.product.__dict__, self.metadata.name)
 
+        if self.metadata.name in StatisticName.__members__:
+            return getattr(self.product, self.metadata.name)
+
         value = get_child_value(self.product.properties, self.metadata.name)
 
         if self.metadata.name == PERSON_NAME:
@@ -85,3 +100,14 @@ class EufySecuritySensor(SensorEntity, EufySecurityEntity):
         if len(str(value)) > 250:
             value = str(value)[-250:]
         return value
+
+    @property
+    def extra_state_attributes(self):
+        if self.metadata.name == StatisticName.commands_in_flight.name:
+            compression = self.product.api.compression_statistics
+            if compression:
+                return {**self.product.api.command_statistics, "compression": compression}
+            return self.product.api.command_statistics
+        if self.metadata.name == StatisticName.event_backlog_peak.name:
+            return self.product.api.event_statistics
+        return None
@@ -24,14 +24,14 @@ def get_properties_by_filter(metadata: dict, filtering: MetadataFilter) -> dict:
             else:
                 if filtering.any_fields is not None:
                     for field in filtering.any_fields:
-                        if value.__dict__.get(field, None) is not None:
+                        if getattr(value, field, None) is not None:
                             to_add = True
                             break
 
                 if filtering.no_fields is not None:
                     count_no_fields = len(filtering.no_fields)
                     for field in filtering.no_fields:
-                        if value.__dict__.get(field, None) is not None:
+                        if getattr(value, field, None) is not None:
                             count_no_fields = -1
                             break
                         else: